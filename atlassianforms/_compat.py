@@ -0,0 +1,36 @@
+import json
+import sys
+from typing import Any, Callable, Dict, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# `dataclass(slots=True)` is only available from Python 3.10 onwards. On older
+# interpreters the dataclasses keep their instance `__dict__`.
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# JSON decoder for raw API payloads: orjson when it is installed (the `fast`
+# extra), the standard library otherwise.
+json_loads: Callable[[Union[bytes, str]], Any] = (
+    orjson.loads if orjson is not None else json.loads
+)
+
+
+def _intern(value: Any) -> Any:
+    """
+    Intern a string so that repeated dictionary lookups on it can be resolved
+    by identity. Non-string values are returned unchanged.
+
+    Parameters
+    ----------
+    value : Any
+        The value to intern.
+
+    Returns
+    -------
+    Any
+        The interned string, or the original value if it is not a string.
+    """
+    return sys.intern(value) if type(value) is str else value
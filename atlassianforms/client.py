@@ -1,6 +1,6 @@
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List
 
-from atlassianforms.form.manager import ServiceDeskFormManager
+from atlassianforms.form.manager import ServiceDeskFormFilled, ServiceDeskFormManager
 from atlassianforms.form.parser import ServiceDeskFormParser
 from atlassianforms.manager import ServiceDeskManager
 from atlassianforms.models.response import CreateRequestResponseParser
@@ -39,6 +39,8 @@ class ServiceDeskFormClient:
         Lists possible values for a specific field in the form.
     set_form_values(values: Dict[str, Any]) -> Dict[str, Any]
         Sets the values for the form fields.
+    set_form_values_many(batch: Iterable[Dict[str, Any]]) -> List[ServiceDeskFormFilled]
+        Sets several sets of values for the form fields at once.
     create_request(filled_values: Dict[str, Any]) -> CreateRequestResponseParser
         Creates a service desk request with the filled form values.
     """
@@ -135,6 +137,32 @@ class ServiceDeskFormClient:
             raise ValueError(FORM_DIDNT_FETCH_ERROR)
         return self.form_manager.set_field_values(values)
 
+    def set_form_values_many(
+        self, batch: Iterable[Dict[str, Any]]
+    ) -> List[ServiceDeskFormFilled]:
+        """
+        Sets several sets of values for the form fields, validating them as one batch.
+
+        Parameters
+        ----------
+        batch : Iterable[Dict[str, Any]]
+            Dictionaries where the keys are field names and the values are the values
+            to set for the fields.
+
+        Returns
+        -------
+        List[ServiceDeskFormFilled]
+            The filled forms ready to be submitted as requests, in the order of the batch.
+
+        Raises
+        ------
+        ValueError
+            If the form has not been fetched and parsed.
+        """
+        if self.form_manager is None:
+            raise ValueError(FORM_DIDNT_FETCH_ERROR)
+        return self.form_manager.set_field_values_many(batch)
+
     def create_request(
         self, filled_values: Dict[str, Any]
     ) -> CreateRequestResponseParser:
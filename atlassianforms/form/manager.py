@@ -1,17 +1,173 @@
 import json
-import urllib.parse
+import re
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple, Union
-
-from atlassianforms.form.parser import (
-    ServiceDeskForm,
-    ServiceDeskFormField,
-    ServiceDeskFormFieldValue,
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
 )
+from urllib.parse import quote_plus
+
+from atlassianforms._compat import DATACLASS_SLOTS
+from atlassianforms.form.parser import ServiceDeskForm, ServiceDeskFormField
 from atlassianforms.validators.field import ServiceDeskFormValidator
 
+# Compact encoder shared by every payload; non-ASCII text is kept as-is since
+# the payload is percent-encoded as UTF-8 afterwards anyway.
+_encode_compact_json = json.JSONEncoder(
+    separators=(",", ":"), ensure_ascii=False
+).encode
+
+# Proforma answer for rich text fields, with the JSON-encoded text substituted in.
+_ADF_ANSWER_TEMPLATE = (
+    '{{"adf":{{"version":1,"type":"doc","content":[{{"type":"paragraph",'
+    '"content":[{{"type":"text","text":{text}}}]}}]}}}}'
+)
+
+
+class _EncodedJSON(str):
+    """
+    A string holding an already JSON-encoded value, embedded verbatim when the
+    proformaFormData section is serialized.
+    """
+
+
+def _encode_json(value: Any) -> str:
+    """
+    JSON-encode a value in compact form, passing pre-encoded values through.
+
+    Parameters
+    ----------
+    value : Any
+        The value to encode.
+
+    Returns
+    -------
+    str
+        The JSON representation of the value.
+    """
+    if isinstance(value, _EncodedJSON):
+        return value
+    return _encode_compact_json(value)
+
+
+def _encode_key(key: Any) -> str:
+    """
+    JSON-encode an object key, converting non-string keys the way `json.dumps`
+    does (e.g. None becomes "null" and 1 becomes "1").
+
+    Parameters
+    ----------
+    key : Any
+        The key to encode.
+
+    Returns
+    -------
+    str
+        The JSON string representing the key.
+
+    Raises
+    ------
+    TypeError
+        If the key is not a str, int, float, bool or None.
+    """
+    if not isinstance(key, str):
+        if key is not None and not isinstance(key, (int, float)):
+            raise TypeError(
+                f"keys must be str, int, float, bool or None, not {type(key).__name__}"
+            )
+        key = _encode_compact_json(key)
+    return _encode_compact_json(key)
+
+
+def _encode_proforma_data(template_id: Any, answers: Dict[Any, Any]) -> str:
+    """
+    Serialize the proformaFormData section of the request payload.
+
+    Parameters
+    ----------
+    template_id : Any
+        The ID of the proforma template the answers belong to.
+    answers : Dict[Any, Any]
+        The proforma answers keyed by question ID.
+
+    Returns
+    -------
+    str
+        The JSON-encoded proformaFormData section.
+    """
+    encoded_answers = ",".join(
+        f"{_encode_key(question_id)}:{_encode_json(answer)}"
+        for question_id, answer in answers.items()
+    )
+    return (
+        f'{{"templateFormId":{_encode_json(template_id)},'
+        f'"answers":{{{encoded_answers}}}}}'
+    )
+
+
+@lru_cache(maxsize=None)
+def _encode_empty_proforma_data(template_id: Any) -> str:
+    """
+    Serialize the proformaFormData section for payloads without proforma answers.
+    It only depends on the template ID, so it is cached.
+
+    Parameters
+    ----------
+    template_id : Any
+        The ID of the proforma template.
+
+    Returns
+    -------
+    str
+        The JSON-encoded proformaFormData section with no answers.
+    """
+    return _encode_proforma_data(template_id, {})
+
+
+# Field types whose values are converted from labels to choice ids.
+_CHOICE_FIELD_TYPES = frozenset(
+    {"cascadingselect", "select", "radiobuttons", "multiselect"}
+)
+
+# Characters that `quote_plus` never escapes.
+_URL_SAFE_RE = re.compile(r"[A-Za-z0-9_.~-]*")
+
+
+def _quote_value(value: Any) -> str:
+    """
+    URL-encode a single payload value the same way `urllib.parse.urlencode` does.
+
+    Parameters
+    ----------
+    value : Any
+        The value to encode. Non-string values are converted with `str`.
 
-@dataclass
+    Returns
+    -------
+    str
+        The percent-encoded value.
+    """
+    if isinstance(value, bytes):
+        return quote_plus(value)
+    if not isinstance(value, str):
+        value = str(value)
+    # Identifiers, dates and numbers rarely need escaping; skip the quoter for them.
+    if _URL_SAFE_RE.fullmatch(value):
+        return value
+    return quote_plus(value)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ServiceDeskFormFilled:
     form: ServiceDeskForm
     filled_values: Dict[str, Any] = field(default_factory=dict)
@@ -29,105 +185,157 @@ class ServiceDeskFormFilled:
         str
             The URL-encoded payload for the API request.
         """
-        # Process all fields and combine results
-        regular_fields = self._process_regular_fields()
-        proforma_data = self._construct_proforma_data()
-
-        # Add the proformaFormData as a JSON string
-        regular_fields["proformaFormData"] = json.dumps(proforma_data)
-        regular_fields["projectId"] = str(self.form.project_id)
-
-        # URL-encode the entire payload
-        url_encoded_payload = urllib.parse.urlencode(regular_fields)
+        parts = [
+            f"{_quote_value(key)}={_quote_value(value)}"
+            for key, value in self._build_payload_dict().items()
+        ]
+        parts.append(f"projectId={_quote_value(self.form.project_id)}")
 
-        return url_encoded_payload
+        return "&".join(parts)
 
-    def _process_regular_fields(self) -> Dict[str, Any]:
+    def _build_payload_dict(self) -> Dict[str, Any]:
         """
-        Process regular fields from the filled values.
+        Build the request body as a dictionary of regular fields plus the
+        JSON-encoded proformaFormData section, in a single pass over the filled
+        values. Values for fields that are not part of the form are ignored.
 
         Returns
         -------
         Dict[str, Any]
-            A dictionary of regular fields with their values.
+            The regular fields with their values and the proformaFormData entry.
         """
-        regular_fields = {}
-        for field in self.form.fields:
-            field_id = field.field_id
-            if field_id in self.filled_values and not field.is_proforma_field:
-                regular_fields[field_id] = self.filled_values[field_id]
-        return regular_fields
+        payload = {}
+        proforma_answers = {}
+        for field_id, value in self.filled_values.items():
+            field = self.form.get_field_by_id(field_id)
+            if field is None:
+                continue
+            if field.is_proforma_field:
+                proforma_answers[field.proforma_question_id] = (
+                    self._process_proforma_field(field, value)
+                )
+            else:
+                payload[field_id] = value
+
+        if proforma_answers:
+            payload["proformaFormData"] = _encode_proforma_data(
+                self.form.template_id, proforma_answers
+            )
+        else:
+            payload["proformaFormData"] = _encode_empty_proforma_data(
+                self.form.template_id
+            )
+        return payload
 
-    def _construct_proforma_data(self) -> Dict[str, Any]:
+    def _process_proforma_field(
+        self, field: ServiceDeskFormField, value: Any
+    ) -> Union[Dict[str, Any], str]:
         """
-        Construct the proformaFormData section of the payload.
+        Process a proforma field and convert it into the appropriate format.
+
+        Parameters
+        ----------
+        field : ServiceDeskFormField
+            The field being processed.
+        value : Any
+            The filled value of the field.
 
         Returns
         -------
-        Dict[str, Any]
-            The proformaFormData section.
+        Union[Dict[str, Any], str]
+            The processed proforma field in the correct format. Rich text answers
+            are returned already JSON-encoded.
         """
-        proforma_answers = {}
-
-        for field in self.form.fields:
-            field_id = field.field_id
-            if field_id in self.filled_values and field.is_proforma_field:
-                proforma_answers[
-                    field.proforma_question_id
-                ] = self._process_proforma_field(field_id, field.field_type)
+        # Logic made for Proforma Form fields that have options
+        field_type = field.field_type
+        if isinstance(field.values, list) and len(field.values) > 1:
+            field_type = "cl"
 
-        return {"templateFormId": self.form.template_id, "answers": proforma_answers}
+        handler = self._PROFORMA_ANSWER_HANDLERS.get(
+            field_type, ServiceDeskFormFilled._create_text_answer
+        )
+        return handler(self, field, value)
 
-    def _process_proforma_field(self, field_id: str, field_type: str) -> Dict[str, Any]:
+    def _create_text_answer(
+        self, field: ServiceDeskFormField, value: str
+    ) -> Dict[str, Any]:
         """
-        Process a proforma field and convert it into the appropriate format.
+        Create the answer for a simple text field.
 
         Parameters
         ----------
-        field_id : str
-            The ID of the field being processed.
-        field_type : str
-            The type of the field.
+        field : ServiceDeskFormField
+            The field being answered.
+        value : str
+            The text of the answer.
 
         Returns
         -------
         Dict[str, Any]
-            The processed proforma field in the correct format.
+            The text answer.
         """
-        # Logic made for Proforma Form fields that have options
-        form_values = self.form.get_field_by_id(field_id).values
-        if isinstance(form_values, list) and len(form_values) > 1:
-            field_type = "cl"
+        return {"text": value}
 
-        value = self.filled_values[field_id]
+    def _create_choice_answer(
+        self, field: ServiceDeskFormField, value: str
+    ) -> Dict[str, Any]:
+        """
+        Create the answer for a choice field, converting the value to its choice ID.
 
-        # Handle rich text fields with ADF formatting
-        if field_type in ["rt", "cd"]:
-            return {"adf": self._create_adf_document(value)}
+        Parameters
+        ----------
+        field : ServiceDeskFormField
+            The field being answered.
+        value : str
+            The label or ID of the chosen value.
 
-        # Handle choice fields
-        elif field_type == "cl":
-            # Convert value to the corresponding ID for the choice
-            choice_id = self._get_choice_id(field_id, value)
-            return {"text": "", "choices": [choice_id]}
+        Returns
+        -------
+        Dict[str, Any]
+            The choice answer.
+        """
+        choice_id = self._get_choice_id(field, value)
+        return {"text": "", "choices": [choice_id]}
 
-        # Handle date-time fields
-        elif field_type == "dt":
-            date, time = value.split("T")
-            return {"date": date, "time": time}
+    def _create_datetime_answer(
+        self, field: ServiceDeskFormField, value: str
+    ) -> Dict[str, Any]:
+        """
+        Create the answer for a date-time field.
 
-        # Handle simple text fields
-        else:
-            return {"text": value}
+        Parameters
+        ----------
+        field : ServiceDeskFormField
+            The field being answered.
+        value : str
+            The date-time value, formatted as 'YYYY-MM-DDTHH:MM'.
 
-    def _get_choice_id(self, field_id: str, value: str) -> str:
+        Returns
+        -------
+        Dict[str, Any]
+            The date-time answer.
+
+        Raises
+        ------
+        ValueError
+            If the value does not contain exactly one 'T' separator.
+        """
+        date, separator, time = value.partition("T")
+        if not separator or "T" in time:
+            raise ValueError(
+                f"Value '{value}' for field '{field.field_id}' is not formatted as "
+                "'YYYY-MM-DDTHH:MM'."
+            )
+        return {"date": date, "time": time}
+
+    def _get_choice_id(self, field: ServiceDeskFormField, value: str) -> str:
         """
         Retrieve the ID corresponding to a choice value.
 
         Parameters
         ----------
-        field_id : str
-            The ID of the field.
+        field : ServiceDeskFormField
+            The field the choice belongs to.
         value : str
             The choice value to be converted to its ID.
 
@@ -136,40 +344,42 @@ class ServiceDeskFormFilled:
         str
             The ID corresponding to the choice value.
         """
-        field = self.form.get_field_by_id(field_id)
-        if not field:
-            raise ValueError(f"Field ID '{field_id}' not found.")
-
-        # Search through the field's values to find the matching ID
-        for choice in field.values:
-            if choice.label == value or choice.value == value:
-                return choice.value
+        choice = field.get_value(value)
+        if choice is not None:
+            return choice.value
 
         raise ValueError(
-            f"Value '{value}' not found in choices for field '{field_id}'."
+            f"Value '{value}' not found in choices for field '{field.field_id}'."
         )
 
-    def _create_adf_document(self, text: str) -> Dict[str, Any]:
+    def _create_adf_answer(self, field: ServiceDeskFormField, text: str) -> str:
         """
-        Create an ADF (Atlassian Document Format) document.
+        Create the answer for a rich text field as an ADF (Atlassian Document
+        Format) document.
 
         Parameters
         ----------
+        field : ServiceDeskFormField
+            The field being answered.
         text : str
             The text to include in the ADF document.
 
         Returns
         -------
-        Dict[str, Any]
-            A JSON object representing the ADF document.
+        str
+            The JSON-encoded answer containing the ADF document.
         """
-        return {
-            "version": 1,
-            "type": "doc",
-            "content": [
-                {"type": "paragraph", "content": [{"type": "text", "text": text}]}
-            ],
-        }
+        return _EncodedJSON(
+            _ADF_ANSWER_TEMPLATE.format(text=_encode_compact_json(text))
+        )
+
+    # Proforma answer builders by field type; other types are answered as text.
+    _PROFORMA_ANSWER_HANDLERS: ClassVar[Dict[str, Callable[..., Any]]] = {
+        "rt": _create_adf_answer,
+        "cd": _create_adf_answer,
+        "cl": _create_choice_answer,
+        "dt": _create_datetime_answer,
+    }
 
 
 class ServiceDeskFormManager:
@@ -184,8 +394,8 @@ class ServiceDeskFormManager:
 
     Methods
     -------
-    list_fields() -> List[str]:
-        Lists all field labels in the form.
+    list_fields() -> List[Dict[str, str]]:
+        Lists all fields in the form with their label, ID, type and description.
 
     list_field_values(field_identifier: str, parent_value: Optional[str] = None) -> List[str]:
         Lists all possible values for a given field, identified by either label or ID.
@@ -197,6 +407,13 @@ class ServiceDeskFormManager:
     set_field_values(filled_values: Dict[str, Any]) -> ServiceDeskFormFilled:
         Sets the provided values for the form fields, including compound fields with children,
         and returns a ServiceDeskFormFilled instance.
+
+    validate_many(batch: Iterable[Dict[str, Any]]) -> bool:
+        Validates several sets of filled values against the form.
+
+    set_field_values_many(batch: Iterable[Dict[str, Any]]) -> List[ServiceDeskFormFilled]:
+        Sets several sets of values for the form fields and returns one
+        ServiceDeskFormFilled instance per set.
     """
 
     def __init__(self, form: ServiceDeskForm):
@@ -214,7 +431,8 @@ class ServiceDeskFormManager:
     def create_request_payload(self, filled_values: Dict[str, Any]) -> Dict[str, Any]:
         """
         Converts the filled values into the body format required by the API request,
-        handling both regular fields and proformaFormData fields.
+        handling both regular fields and proformaFormData fields. Proforma answers are
+        formatted the same way as in `ServiceDeskFormFilled.to_request_payload`.
 
         Parameters
         ----------
@@ -226,41 +444,17 @@ class ServiceDeskFormManager:
         Dict[str, Any]
             The payload formatted for the API request.
         """
-        regular_fields = {}
-        proforma_answers = {}
-
-        for field in self.form.fields:
-            field_id = field.field_id
-
-            if field_id in filled_values:
-                if field.is_proforma_field:
-                    # Map the proforma question ID to the appropriate answer
-                    proforma_answers[field.proforma_question_id] = filled_values[
-                        field_id
-                    ]
-                else:
-                    # Regular field processing
-                    regular_fields[field_id] = filled_values[field_id]
-
-        # Construct the proformaFormData section
-        proforma_data = {
-            "templateFormId": self.form.template_id,
-            "answers": proforma_answers,
-        }
-
-        # Complete payload combining regular fields and proformaFormData
-        payload = {**regular_fields, "proformaFormData": json.dumps(proforma_data)}
-
-        return payload
+        form_filled = ServiceDeskFormFilled(form=self.form, filled_values=filled_values)
+        return form_filled._build_payload_dict()
 
-    def list_fields(self) -> List[str]:
+    def list_fields(self) -> List[Dict[str, str]]:
         """
-        Lists all field labels in the form.
+        Lists all fields in the form with their label, ID, type and description.
 
         Returns
         -------
-        List[str]
-            A list of field labels.
+        List[Dict[str, str]]
+            The label, ID, type and description of each field.
         """
         return [
             {
@@ -301,7 +495,7 @@ class ServiceDeskFormManager:
                 {"label": value.label, "value": value.value} for value in field.values
             ]
         else:
-            parent = self._get_value_by_label(field.values, parent_value)
+            parent = field.get_value_by_label(parent_value)
             if parent:
                 return [
                     {"label": child.label, "value": child.value}
@@ -328,41 +522,7 @@ class ServiceDeskFormManager:
         Optional[ServiceDeskFormField]
             The ServiceDeskFormField instance if found, None otherwise.
         """
-        return next(
-            (
-                field
-                for field in self.form.fields
-                if field.field_id == identifier or field.label == identifier
-            ),
-            None,
-        )
-
-    def _get_value_by_label_or_id(
-        self, values: List[ServiceDeskFormFieldValue], identifier: str
-    ) -> Optional[ServiceDeskFormFieldValue]:
-        """
-        Retrieves a value by its label or ID from a list of ServiceDeskFormFieldValue instances.
-
-        Parameters
-        ----------
-        values : List[ServiceDeskFormFieldValue]
-            The list of ServiceDeskFormFieldValue instances to search.
-        identifier : str
-            The label or ID of the value to retrieve.
-
-        Returns
-        -------
-        Optional[ServiceDeskFormFieldValue]
-            The ServiceDeskFormFieldValue instance if found, None otherwise.
-        """
-        return next(
-            (
-                value
-                for value in values
-                if value.label == identifier or value.value == identifier
-            ),
-            None,
-        )
+        return self.form.get_field_by_id_or_label(identifier)
 
     def validate(self, filled_values: Dict[str, Any]) -> bool:
         """
@@ -378,10 +538,7 @@ class ServiceDeskFormManager:
         bool
             True if the filled values are valid, otherwise raises an exception.
         """
-        required_fields = [
-            field.field_id for field in self.form.fields if field.is_required()
-        ]
-        missing_fields = set(required_fields) - set(filled_values.keys())
+        missing_fields = self._missing_required_fields(filled_values)
 
         if missing_fields:
             raise ValueError(f"Missing required fields: {missing_fields}")
@@ -390,6 +547,45 @@ class ServiceDeskFormManager:
         self.validator.validate(filled_values, self.form)
         return True
 
+    def validate_many(self, batch: Iterable[Dict[str, Any]]) -> bool:
+        """
+        Validates several sets of filled values according to the required fields in
+        the form.
+
+        Parameters
+        ----------
+        batch : Iterable[Dict[str, Any]]
+            The dictionaries of filled field values to validate.
+
+        Returns
+        -------
+        bool
+            True if every set of filled values is valid, otherwise raises an exception.
+        """
+        for filled_values in batch:
+            self.validate(filled_values)
+        return True
+
+    def _missing_required_fields(self, filled_values: Dict[str, Any]) -> Set[str]:
+        """
+        Collects the IDs of the required fields that have no filled value.
+
+        Parameters
+        ----------
+        filled_values : Dict[str, Any]
+            The dictionary of filled field values, keyed by field ID.
+
+        Returns
+        -------
+        Set[str]
+            The IDs of the missing required fields.
+        """
+        return {
+            form_field.field_id
+            for form_field in self.form.get_required_fields()
+            if form_field.field_id not in filled_values
+        }
+
     def set_field_values(self, filled_values: Dict[str, Any]) -> ServiceDeskFormFilled:
         """
         Sets the provided values for the form fields, including compound fields with children,
@@ -405,41 +601,42 @@ class ServiceDeskFormManager:
         ServiceDeskFormFilled
             An instance of ServiceDeskFormFilled with the provided values.
         """
-        # Convert labels to IDs if necessary
+        # Convert labels to IDs, splitting compound fields into field and subfield
         filled_values = self._convert_labels_to_ids(filled_values)
 
         # Validate the filled values
         self.validate(filled_values)
 
-        # Flatten compound fields with children
-        flat_filled_values = self._flatten_field_values(filled_values)
-
         # Create the ServiceDeskFormFilled instance
-        form_filled = ServiceDeskFormFilled(
-            form=self.form, filled_values=flat_filled_values
-        )
+        form_filled = ServiceDeskFormFilled(form=self.form, filled_values=filled_values)
 
         return form_filled
 
-    def _get_value_by_label(
-        self, values: List[ServiceDeskFormFieldValue], label: str
-    ) -> Optional[ServiceDeskFormFieldValue]:
+    def set_field_values_many(
+        self, batch: Iterable[Dict[str, Any]]
+    ) -> List[ServiceDeskFormFilled]:
         """
-        Retrieves a value by its label from a list of ServiceDeskFormFieldValue instances.
+        Sets several sets of values for the form fields, validating them as one batch,
+        and returns a ServiceDeskFormFilled instance for each of them.
 
         Parameters
         ----------
-        values : List[ServiceDeskFormFieldValue]
-            The list of ServiceDeskFormFieldValue instances to search.
-        label : str
-            The label of the value to retrieve.
+        batch : Iterable[Dict[str, Any]]
+            The dictionaries of filled field values, identified by either labels or IDs.
 
         Returns
         -------
-        Optional[ServiceDeskFormFieldValue]
-            The ServiceDeskFormFieldValue instance if found, None otherwise.
+        List[ServiceDeskFormFilled]
+            The filled forms, in the order of the batch.
         """
-        return next((value for value in values if value.label == label), None)
+        converted = [
+            self._convert_labels_to_ids(filled_values) for filled_values in batch
+        ]
+        self.validate_many(converted)
+        return [
+            ServiceDeskFormFilled(form=self.form, filled_values=filled_values)
+            for filled_values in converted
+        ]
 
     def _convert_labels_to_ids(self, filled_values: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -455,30 +652,39 @@ class ServiceDeskFormManager:
         Dict[str, Any]
             The dictionary with labels converted to IDs.
         """
-        converted_values = {}
+        return dict(self._iter_converted(filled_values))
+
+    def _iter_converted(
+        self, filled_values: Dict[str, Any]
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Yields the (field ID, value ID) pairs of the filled values, converting labels
+        to IDs. Compound fields yield one pair for the main field and one for its subfield.
+
+        Parameters
+        ----------
+        filled_values : Dict[str, Any]
+            The dictionary of filled field values, which may contain labels instead of IDs.
+
+        Yields
+        ------
+        Tuple[str, Any]
+            The field ID and its converted value.
+        """
         for field_identifier, value in filled_values.items():
             field = self._get_field_by_id_or_label(field_identifier)
             if not field:
                 raise ValueError(f"Field '{field_identifier}' not found in the form.")
 
             # Ensure correct handling of compound fields and label-to-ID conversion
-            if field.field_type in [
-                "cascadingselect",
-                "select",
-                "radiobuttons",
-                "multiselect",
-            ]:
+            if field.field_type in _CHOICE_FIELD_TYPES:
                 if self._is_compound_field_value(value):
-                    converted_values.update(self._convert_compound_field(field, value))
+                    yield from self._convert_compound_field(field, value)
                 else:
-                    converted_values[field.field_id] = self._convert_single_field(
-                        field, value
-                    )
+                    yield field.field_id, self._convert_single_field(field, value)
             else:
                 # For text fields and other simple types, directly assign the value
-                converted_values[field.field_id] = value
-
-        return converted_values
+                yield field.field_id, value
 
     def _convert_single_field(
         self, field: ServiceDeskFormField, value: Union[str, List[str]]
@@ -523,7 +729,7 @@ class ServiceDeskFormManager:
         """
         # Check if the field has predefined values, otherwise, return the value as is
         if field.values:
-            value_obj = self._get_value_by_label_or_id(field.values, value)
+            value_obj = field.get_value(value)
             if not value_obj:
                 raise ValueError(
                     f"Invalid value '{value}' for field '{field.label}' or '{field.field_id}'."
@@ -534,7 +740,7 @@ class ServiceDeskFormManager:
 
     def _convert_compound_field(
         self, field: ServiceDeskFormField, value: Union[Tuple[str, str], List[str]]
-    ) -> Dict[str, str]:
+    ) -> Tuple[Tuple[str, str], Tuple[str, str]]:
         """
         Converts a compound field's values from labels to IDs.
 
@@ -547,26 +753,22 @@ class ServiceDeskFormManager:
 
         Returns
         -------
-        Dict[str, str]
-            A dictionary with the main value and sub value IDs.
+        Tuple[Tuple[str, str], Tuple[str, str]]
+            The (field ID, value ID) pairs of the main field and its subfield.
         """
         main_value, sub_value = value
-        main_value_obj = self._get_value_by_label_or_id(field.values, main_value)
-        sub_value_obj = (
-            self._get_value_by_label_or_id(main_value_obj.children, sub_value)
-            if main_value_obj
-            else None
-        )
+        main_value_obj = field.get_value(main_value)
+        sub_value_obj = main_value_obj.get_child(sub_value) if main_value_obj else None
 
         if not main_value_obj or not sub_value_obj:
             raise ValueError(
                 f"Invalid compound value '{main_value}, {sub_value}' for field '{field.label}' or '{field.field_id}'."
             )
 
-        return {
-            field.field_id: main_value_obj.value,
-            f"{field.field_id}:1": sub_value_obj.value,
-        }
+        return (
+            (field.field_id, main_value_obj.value),
+            (f"{field.field_id}:1", sub_value_obj.value),
+        )
 
     def _is_compound_field_value(self, value: Any) -> bool:
         """
@@ -583,29 +785,3 @@ class ServiceDeskFormManager:
             True if the value is a tuple with two elements, indicating a compound field; False otherwise.
         """
         return isinstance(value, tuple) and len(value) == 2
-
-    def _flatten_field_values(self, filled_values: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Flattens compound field values with children into a format that can be easily
-        processed by the Service Desk API.
-
-        Parameters
-        ----------
-        filled_values : Dict[str, Any]
-            The dictionary of filled field values.
-
-        Returns
-        -------
-        Dict[str, Any]
-            The flattened dictionary of filled field values.
-        """
-        flat_values = {}
-        for field_id, value in filled_values.items():
-            if isinstance(value, (tuple, list)) and len(value) == 2:
-                main_value, sub_value = value
-                flat_values[field_id] = main_value
-                flat_values[f"{field_id}:1"] = sub_value
-            else:
-                flat_values[field_id] = value
-
-        return flat_values
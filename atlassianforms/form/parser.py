@@ -1,8 +1,27 @@
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Sequence, Union
 
+from atlassianforms._compat import DATACLASS_SLOTS, _intern, json_loads
 
-@dataclass
+
+def _index_value(index: Dict[str, Any], value: Any) -> None:
+    """
+    Register a value in a lookup index under both its label and its value,
+    keeping the first entry when several share the same key.
+
+    Parameters
+    ----------
+    index : Dict[str, Any]
+        The index to update.
+    value : ServiceDeskFormFieldValue
+        The value to register.
+    """
+    index.setdefault(value.label, value)
+    index.setdefault(value.value, value)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ServiceDeskFormFieldValue:
     """
     Data class representing a value within a Service Desk form field.
@@ -24,6 +43,75 @@ class ServiceDeskFormFieldValue:
     selected: bool = False
     children: List["ServiceDeskFormFieldValue"] = field(default_factory=list)
     additional_data: Dict[str, Any] = field(default_factory=dict)
+    _children_index: Dict[str, "ServiceDeskFormFieldValue"] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _indexed_children: Optional[List["ServiceDeskFormFieldValue"]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _indexed_children_count: int = field(
+        default=0, init=False, repr=False, compare=False
+    )
+
+    def _children_indexed(self) -> bool:
+        return (
+            self._indexed_children is self.children
+            and self._indexed_children_count == len(self.children)
+        )
+
+    def _index_children(self) -> None:
+        # The index remembers the list it was built from and its length, so
+        # replacing the children or appending to them directly rebuilds it.
+        if self._children_indexed():
+            return
+        children = self.children
+        children_index: Dict[str, "ServiceDeskFormFieldValue"] = {}
+        for child in children:
+            _index_value(children_index, child)
+        self._children_index = children_index
+        self._indexed_children = children
+        self._indexed_children_count = len(children)
+
+    @classmethod
+    def _make(
+        cls,
+        value: str,
+        label: str,
+        selected: bool = False,
+        additional_data: Optional[Dict[str, Any]] = None,
+    ) -> "ServiceDeskFormFieldValue":
+        """
+        Create a value without children, bypassing the generated `__init__`.
+
+        Used by the parser, which creates one value per option of every field.
+        Children can be attached afterwards with `add_child`.
+
+        Parameters
+        ----------
+        value : str
+            The value identifier.
+        label : str
+            The label associated with this value.
+        selected : bool
+            Whether this value is pre-selected.
+        additional_data : Optional[Dict[str, Any]]
+            Additional data associated with this value.
+
+        Returns
+        -------
+        ServiceDeskFormFieldValue
+            The new value.
+        """
+        instance = object.__new__(cls)
+        instance.value = value
+        instance.label = label
+        instance.selected = selected
+        instance.children = []
+        instance.additional_data = {} if additional_data is None else additional_data
+        instance._children_index = {}
+        instance._indexed_children = None
+        instance._indexed_children_count = 0
+        return instance
 
     def add_child(self, child_value: "ServiceDeskFormFieldValue") -> None:
         """
@@ -34,7 +122,28 @@ class ServiceDeskFormFieldValue:
         child_value : ServiceDeskFormFieldValue
             The child value to be added.
         """
+        up_to_date = self._children_indexed()
         self.children.append(child_value)
+        if up_to_date:
+            _index_value(self._children_index, child_value)
+            self._indexed_children_count += 1
+
+    def get_child(self, identifier: str) -> Optional["ServiceDeskFormFieldValue"]:
+        """
+        Get a child value by its label or value.
+
+        Parameters
+        ----------
+        identifier : str
+            The label or value of the child to retrieve.
+
+        Returns
+        -------
+        Optional[ServiceDeskFormFieldValue]
+            The first child matching the identifier, or None if not found.
+        """
+        self._index_children()
+        return self._children_index.get(identifier)
 
     def has_children(self) -> bool:
         """
@@ -48,7 +157,7 @@ class ServiceDeskFormFieldValue:
         return len(self.children) > 0
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ServiceDeskFormField:
     """
     Data class representing a field in a Service Desk form.
@@ -71,8 +180,9 @@ class ServiceDeskFormField:
         Whether the field is required or optional.
     displayed : bool
         Whether the field is displayed in the form.
-    preset_values : List[Any]
-        A list of preset values that may be pre-selected or pre-filled.
+    preset_values : Sequence[Any]
+        The preset values that may be pre-selected or pre-filled. Fields without
+        presets share the empty tuple.
     values : List[ServiceDeskFormFieldValue]
         A list of possible values for this field, potentially hierarchical.
     renderer_type : Optional[str]
@@ -97,7 +207,7 @@ class ServiceDeskFormField:
     description_html: str
     required: bool
     displayed: bool
-    preset_values: List[Any] = field(default_factory=list)
+    preset_values: Sequence[Any] = ()
     values: List[ServiceDeskFormFieldValue] = field(default_factory=list)
     renderer_type: Optional[str] = None
     auto_complete_url: Optional[str] = None
@@ -105,6 +215,84 @@ class ServiceDeskFormField:
     children: List["ServiceDeskFormField"] = field(default_factory=list)
     is_proforma_field: bool = False
     proforma_question_id: Optional[str] = None
+    _indexed_values: Optional[List[ServiceDeskFormFieldValue]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _indexed_values_count: int = field(default=0, init=False, repr=False, compare=False)
+    _values_index: Dict[str, ServiceDeskFormFieldValue] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _values_by_label: Dict[str, ServiceDeskFormFieldValue] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _choice_values: FrozenSet[str] = field(
+        default=frozenset(), init=False, repr=False, compare=False
+    )
+
+    def _index_values(self) -> None:
+        # Built on the first lookup: most fields of a parsed form are never
+        # searched, and large option lists would otherwise be indexed eagerly.
+        # The indexes remember the list they were built from and its length, so
+        # assigning new values or appending to them rebuilds them on next lookup.
+        values = self.values
+        if self._indexed_values is values and self._indexed_values_count == len(values):
+            return
+        values_index: Dict[str, ServiceDeskFormFieldValue] = {}
+        values_by_label: Dict[str, ServiceDeskFormFieldValue] = {}
+        for value in values:
+            _index_value(values_index, value)
+            values_by_label.setdefault(value.label, value)
+        self._values_index = values_index
+        self._values_by_label = values_by_label
+        self._choice_values = frozenset(value.value for value in values)
+        self._indexed_values = values
+        self._indexed_values_count = len(values)
+
+    def get_value(self, identifier: str) -> Optional[ServiceDeskFormFieldValue]:
+        """
+        Get a possible value of the field by its label or value.
+
+        Parameters
+        ----------
+        identifier : str
+            The label or value to retrieve.
+
+        Returns
+        -------
+        Optional[ServiceDeskFormFieldValue]
+            The first value matching the identifier, or None if not found.
+        """
+        self._index_values()
+        return self._values_index.get(identifier)
+
+    def get_value_by_label(self, label: str) -> Optional[ServiceDeskFormFieldValue]:
+        """
+        Get a possible value of the field by its label.
+
+        Parameters
+        ----------
+        label : str
+            The label of the value to retrieve.
+
+        Returns
+        -------
+        Optional[ServiceDeskFormFieldValue]
+            The first value with the given label, or None if not found.
+        """
+        self._index_values()
+        return self._values_by_label.get(label)
+
+    def get_choice_values(self) -> FrozenSet[str]:
+        """
+        Get the set of values that can be chosen for this field.
+
+        Returns
+        -------
+        FrozenSet[str]
+            The ``value`` of every top-level possible value of the field.
+        """
+        self._index_values()
+        return self._choice_values
 
     def is_required(self) -> bool:
         """
@@ -162,7 +350,7 @@ class ServiceDeskFormField:
         return self.depends_on is not None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ServiceDeskForm:
     """
     Data class representing a Service Desk form.
@@ -200,6 +388,54 @@ class ServiceDeskForm:
     template_id: Optional[int] = None
     template_form_uuid: Optional[str] = None
     atl_token: Optional[str] = None
+    _fields_by_id: Dict[str, ServiceDeskFormField] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _indexed_fields: Optional[List[ServiceDeskFormField]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _indexed_fields_count: int = field(default=0, init=False, repr=False, compare=False)
+    _required_fields: Optional[List[ServiceDeskFormField]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _dependent_fields: Optional[List[ServiceDeskFormField]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _has_autocomplete: Optional[bool] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _fields_by_key: Optional[Dict[str, ServiceDeskFormField]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self._index_fields()
+
+    def _fields_indexed(self) -> bool:
+        return (
+            self._indexed_fields is self.fields
+            and self._indexed_fields_count == len(self.fields)
+        )
+
+    def _index_fields(self) -> None:
+        # The caches remember the list they were built from and its length, so
+        # replacing the fields or appending to them directly rebuilds them.
+        if self._fields_indexed():
+            return
+        fields = self.fields
+        fields_by_id: Dict[str, ServiceDeskFormField] = {}
+        for form_field in fields:
+            fields_by_id.setdefault(form_field.field_id, form_field)
+        self._fields_by_id = fields_by_id
+        self._indexed_fields = fields
+        self._indexed_fields_count = len(fields)
+        self._invalidate_caches()
+
+    def _invalidate_caches(self) -> None:
+        self._required_fields = None
+        self._dependent_fields = None
+        self._has_autocomplete = None
+        self._fields_by_key = None
 
     def add_field(self, field: ServiceDeskFormField) -> None:
         """
@@ -210,7 +446,12 @@ class ServiceDeskForm:
         field : ServiceDeskFormField
             The field to be added to the form.
         """
+        up_to_date = self._fields_indexed()
         self.fields.append(field)
+        if up_to_date:
+            self._fields_by_id.setdefault(field.field_id, field)
+            self._indexed_fields_count += 1
+            self._invalidate_caches()
 
     def get_required_fields(self) -> List[ServiceDeskFormField]:
         """
@@ -221,7 +462,10 @@ class ServiceDeskForm:
         List[ServiceDeskFormField]
             A list of required fields.
         """
-        return [field for field in self.fields if field.is_required()]
+        self._index_fields()
+        if self._required_fields is None:
+            self._required_fields = [field for field in self.fields if field.required]
+        return list(self._required_fields)
 
     def get_field_by_id(self, field_id: str) -> Optional[ServiceDeskFormField]:
         """
@@ -237,9 +481,36 @@ class ServiceDeskForm:
         Optional[ServiceDeskFormField]
             The field with the given ID, or None if not found.
         """
-        return next(
-            (field for field in self.fields if field.field_id == field_id), None
-        )
+        self._index_fields()
+        return self._fields_by_id.get(field_id)
+
+    def get_field_by_id_or_label(
+        self, identifier: str
+    ) -> Optional[ServiceDeskFormField]:
+        """
+        Get a field by its ID or label.
+
+        Fields are matched in form order, so the first field whose ID or label
+        equals the identifier wins.
+
+        Parameters
+        ----------
+        identifier : str
+            The ID or label of the field to retrieve.
+
+        Returns
+        -------
+        Optional[ServiceDeskFormField]
+            The matching field, or None if not found.
+        """
+        self._index_fields()
+        if self._fields_by_key is None:
+            fields_by_key: Dict[str, ServiceDeskFormField] = {}
+            for form_field in self.fields:
+                fields_by_key.setdefault(form_field.field_id, form_field)
+                fields_by_key.setdefault(form_field.label, form_field)
+            self._fields_by_key = fields_by_key
+        return self._fields_by_key.get(identifier)
 
     def has_autocomplete_fields(self) -> bool:
         """
@@ -250,7 +521,12 @@ class ServiceDeskForm:
         bool
             True if any field in the form has autocomplete, False otherwise.
         """
-        return any(field.has_autocomplete() for field in self.fields)
+        self._index_fields()
+        if self._has_autocomplete is None:
+            self._has_autocomplete = any(
+                field.has_autocomplete() for field in self.fields
+            )
+        return self._has_autocomplete
 
     def get_dependent_fields(self) -> List[ServiceDeskFormField]:
         """
@@ -261,7 +537,12 @@ class ServiceDeskForm:
         List[ServiceDeskFormField]
             A list of fields with dependencies.
         """
-        return [field for field in self.fields if field.is_dependent()]
+        self._index_fields()
+        if self._dependent_fields is None:
+            self._dependent_fields = [
+                field for field in self.fields if field.is_dependent()
+            ]
+        return list(self._dependent_fields)
 
 
 class ServiceDeskFormParser:
@@ -274,17 +555,40 @@ class ServiceDeskFormParser:
     -------
     parse(json_data: Dict[str, Any]) -> ServiceDeskForm
         Parses the JSON data and returns a ServiceDeskForm object.
+    parse_bytes(raw: Union[bytes, str]) -> ServiceDeskForm
+        Decodes a raw JSON payload and returns a ServiceDeskForm object.
     _parse_field(field_data: Dict[str, Any]) -> List[ServiceDeskFormField]
         Parses a single field's data and returns a list of ServiceDeskFormField objects,
         including the main field and subfields.
-    _parse_values(values_data: List[Dict[str, Any]], parent_field_id: str = "") -> List[ServiceDeskFormFieldValue]
-        Parses a list of values and returns a list of ServiceDeskFormFieldValue objects.
+    _parse_values(values_data: List[Dict[str, Any]]) -> List[ServiceDeskFormFieldValue]
+        Parses a list of values, including nested children, and returns a list of
+        ServiceDeskFormFieldValue objects.
     _parse_proforma_fields(proforma_data: Dict[str, Any]) -> List[ServiceDeskFormField]
         Parses proforma fields and returns a list of ServiceDeskFormField objects.
     _parse_cascadingselect_field(field: ServiceDeskFormField) -> List[ServiceDeskFormField]
         Parses and adds subfields for a cascadingselect field.
     """
 
+    @staticmethod
+    def parse_bytes(raw: Union[bytes, str]) -> ServiceDeskForm:
+        """
+        Decodes a raw JSON payload and returns a ServiceDeskForm object.
+
+        The payload is decoded with orjson when it is installed, which is
+        considerably faster than the standard library on large forms.
+
+        Parameters
+        ----------
+        raw : Union[bytes, str]
+            The raw JSON payload from the Atlassian Service Desk API.
+
+        Returns
+        -------
+        ServiceDeskForm
+            An instance of ServiceDeskForm containing parsed data.
+        """
+        return ServiceDeskFormParser.parse(json_loads(raw))
+
     @staticmethod
     def parse(json_data: Dict[str, Any]) -> ServiceDeskForm:
         """
@@ -300,35 +604,45 @@ class ServiceDeskFormParser:
         ServiceDeskForm
             An instance of ServiceDeskForm containing parsed data.
         """
-        form_id = json_data["portal"]["id"]
-        request_type_id = json_data["reqCreate"]["id"]
-        service_desk_id = json_data["portal"]["serviceDeskId"]
-        project_id = json_data["portal"]["projectId"]
-        portal_name = json_data["portal"]["name"]
-        portal_description = json_data["portal"].get("description", "")
-        form_name = json_data["reqCreate"]["form"]["name"]
-        form_description_html = json_data["reqCreate"]["form"]["descriptionHtml"]
-
-        fields_data = json_data["reqCreate"]["fields"]
+        portal = json_data["portal"]
+        req_create = json_data["reqCreate"]
+        form_id = portal["id"]
+        request_type_id = req_create["id"]
+        service_desk_id = portal["serviceDeskId"]
+        project_id = portal["projectId"]
+        portal_name = portal["name"]
+        portal_description = portal.get("description", "")
+        form_name = req_create["form"]["name"]
+        form_description_html = req_create["form"]["descriptionHtml"]
+
+        fields_data = req_create["fields"]
         fields = []
+        autocomplete_fields_data = []
         for field_data in fields_data:
-            if (
-                "autoCompleteUrl" not in field_data.keys()
-                or field_data["autoCompleteUrl"] == ""
-            ):
+            if field_data.get("autoCompleteUrl", "") == "":
                 parsed_fields = ServiceDeskFormParser._parse_field(field_data)
                 fields.extend(parsed_fields)
+            else:
+                autocomplete_fields_data.append(field_data)
 
-        if "proformaTemplateForm" in json_data["reqCreate"]:
+        proforma_template_form = req_create.get("proformaTemplateForm")
+        if proforma_template_form is not None:
             proforma_fields = ServiceDeskFormParser._parse_proforma_fields(
-                json_data["reqCreate"]["proformaTemplateForm"]
+                proforma_template_form
             )
             fields.extend(proforma_fields)
+        else:
+            proforma_template_form = {}
+
+        if autocomplete_fields_data:
+            autocomplete_options: Dict[str, Dict[str, Any]] = {}
+            for options in req_create.get("autocompleteOptions", []):
+                autocomplete_options.setdefault(options["fieldId"], options)
+            parsed_fields = ServiceDeskFormParser._parse_autocomplete_fields(
+                autocomplete_fields_data, autocomplete_options
+            )
+            fields.extend(parsed_fields)
 
-        parsed_fields = ServiceDeskFormParser._parse_autocomplete_fields(json_data)
-        fields.extend(parsed_fields)
-
-        proforma_template_form = json_data["reqCreate"].get("proformaTemplateForm", {})
         updated_at = proforma_template_form.get("updated")
 
         design_settings = proforma_template_form.get("design", {}).get("settings", {})
@@ -367,37 +681,23 @@ class ServiceDeskFormParser:
         List[ServiceDeskFormField]
             A list of ServiceDeskFormField objects, including the main field and subfields.
         """
-        field_type = field_data["fieldType"]
-        field_id = field_data["fieldId"]
-        field_config_id = field_data.get("fieldConfigId", "")
-        label = field_data["label"]
-        description = field_data.get("description", "")
-        description_html = field_data.get("descriptionHtml", "")
-        required = field_data["required"]
-        displayed = field_data["displayed"]
-        preset_values = field_data.get("presetValues", [])
-
-        values_data = field_data.get("values", [])
-        values = ServiceDeskFormParser._parse_values(values_data, field_id)
-
-        renderer_type = field_data.get("rendererType")
-        auto_complete_url = field_data.get("autoCompleteUrl")
-        depends_on = field_data.get("depends_on")
+        get = field_data.get
+        field_type = _intern(field_data["fieldType"])
 
         main_field = ServiceDeskFormField(
             field_type=field_type,
-            field_id=field_id,
-            field_config_id=field_config_id,
-            label=label,
-            description=description,
-            description_html=description_html,
-            required=required,
-            displayed=displayed,
-            preset_values=preset_values,
-            values=values,
-            renderer_type=renderer_type,
-            auto_complete_url=auto_complete_url,
-            depends_on=depends_on,
+            field_id=_intern(field_data["fieldId"]),
+            field_config_id=get("fieldConfigId", ""),
+            label=_intern(field_data["label"]),
+            description=get("description", ""),
+            description_html=get("descriptionHtml", ""),
+            required=field_data["required"],
+            displayed=field_data["displayed"],
+            preset_values=get("presetValues") or (),
+            values=ServiceDeskFormParser._parse_values(get("values", [])),
+            renderer_type=_intern(get("rendererType")),
+            auto_complete_url=get("autoCompleteUrl"),
+            depends_on=get("depends_on"),
             children=[],
         )
 
@@ -409,99 +709,100 @@ class ServiceDeskFormParser:
     @staticmethod
     def _parse_autocomplete_values(values_data: Any) -> List[ServiceDeskFormFieldValue]:
         """
-        Transforms a single result entry from the original JSON format to the new format.
+        Transforms the autocomplete results of a field into field values.
 
         Parameters
         ----------
         values_data : Dict[str, Any]
-            A single result entry from the original JSON.
+            The autocomplete options of a field, with the objects under "results".
 
         Returns
         -------
-        Dict[str, Any]
-            The transformed values_data entry.
-        """
-        values = []
+        List[ServiceDeskFormFieldValue]
+            One value per object, with the object details in `additional_data`.
+            Objects of the same type share a single read-only `objectType`
+            mapping; copy it with `dict()` to change it.
+        """
+        make = ServiceDeskFormFieldValue._make
+        object_types: Dict[Any, Mapping[str, Any]] = {}
+        values: List[ServiceDeskFormFieldValue] = []
+        append = values.append
         for value_data in values_data["results"]:
             object_type = value_data["objectType"]
-            attributes = value_data["attributes"][0]
-            value_dict = {
-                "value": value_data["objectId"],
-                "label": value_data["label"],
-                "additional_data": {
-                    "workspaceId": value_data["workspaceId"],
-                    "objectKey": value_data["objectKey"],
-                    "objectType": {
+            object_type_data = object_types.get(object_type["id"])
+            if object_type_data is None:
+                object_type_data = object_types[object_type["id"]] = MappingProxyType(
+                    {
                         "objectTypeId": object_type["objectTypeId"],
                         "id": object_type["id"],
                         "name": object_type["name"],
                         "description": object_type["description"],
-                    },
-                    "objectTypeAttributeId": attributes["objectTypeAttributeId"],
-                    "objectTypeAttributeName": attributes["objectTypeAttribute"][
-                        "name"
-                    ],
-                    "objectTypeAttributeType": attributes["objectTypeAttribute"][
-                        "type"
-                    ],
-                    "objectTypeAttributeDescription": attributes["objectTypeAttribute"][
-                        "description"
-                    ],
-                    "objectTypeAttributeValues": attributes["objectAttributeValues"],
-                },
-                "selected": False,
-                "children": [],
+                    }
+                )
+            attributes = value_data["attributes"][0]
+            object_type_attribute = attributes["objectTypeAttribute"]
+            additional_data = {
+                "workspaceId": _intern(value_data["workspaceId"]),
+                "objectKey": value_data["objectKey"],
+                "objectType": object_type_data,
+                "objectTypeAttributeId": _intern(attributes["objectTypeAttributeId"]),
+                "objectTypeAttributeName": _intern(object_type_attribute["name"]),
+                "objectTypeAttributeType": _intern(object_type_attribute["type"]),
+                "objectTypeAttributeDescription": _intern(
+                    object_type_attribute["description"]
+                ),
+                "objectTypeAttributeValues": attributes["objectAttributeValues"],
             }
-            field_value = ServiceDeskFormFieldValue(**value_dict)
-            values.append(field_value)
+            append(
+                make(
+                    _intern(value_data["objectId"]),
+                    _intern(value_data["label"]),
+                    False,
+                    additional_data,
+                )
+            )
         return values
 
     @staticmethod
     def _parse_autocomplete_fields(
-        values_data: Dict[str, Any]
+        fields_data: List[Dict[str, Any]],
+        autocomplete_options: Dict[str, Dict[str, Any]],
     ) -> List[ServiceDeskFormField]:
         """
-        Parses Proforma fields and returns a list of ServiceDeskFormField objects.
+        Parses autocomplete fields and returns a list of ServiceDeskFormField objects.
 
         Parameters
         ----------
-        proforma_data : Dict[str, Any]
-            The JSON data containing Proforma fields.
+        fields_data : List[Dict[str, Any]]
+            The JSON data of the fields that have an autocomplete URL.
+        autocomplete_options : Dict[str, Dict[str, Any]]
+            The fetched autocomplete options, keyed by field ID.
 
         Returns
         -------
         List[ServiceDeskFormField]
-            A list of ServiceDeskFormField objects parsed from Proforma fields.
+            A list of ServiceDeskFormField objects parsed from CMDB object picker fields.
         """
         autocomplete_fields = []
-        fields = values_data["reqCreate"]["fields"]
-        for field in fields:
-            if (
-                "autoCompleteUrl" in field.keys()
-                and field["autoCompleteUrl"] != ""
-                and field["fieldType"] == "cmdbobjectpicker"
-            ):
+        for field in fields_data:
+            if field["fieldType"] == "cmdbobjectpicker":
                 is_proforma_field = False
                 proforma_question_id = None
-                autocomplete_values = [
-                    field_data
-                    for field_data in values_data["reqCreate"]["autocompleteOptions"]
-                    if field_data["fieldId"] == field["fieldId"]
-                ][0]
+                autocomplete_values = autocomplete_options[field["fieldId"]]
                 values = ServiceDeskFormParser._parse_autocomplete_values(
                     autocomplete_values,
                 )
                 field_field = ServiceDeskFormField(
-                    field_type=field.get("fieldType", ""),
-                    field_id=field.get("fieldId", ""),
+                    field_type=_intern(field.get("fieldType", "")),
+                    field_id=_intern(field.get("fieldId", "")),
                     field_config_id="",
-                    label=field.get("label"),
+                    label=_intern(field.get("label")),
                     description=field.get("description", ""),
                     description_html="",
                     required=field.get("required", False),
                     displayed=field.get("displayed", False),
-                    preset_values=field.get("presetValues", []),
-                    values=[value for value in values if value],
+                    preset_values=field.get("presetValues") or (),
+                    values=values,
                     is_proforma_field=is_proforma_field,
                     proforma_question_id=proforma_question_id,
                 )
@@ -510,7 +811,7 @@ class ServiceDeskFormParser:
 
     @staticmethod
     def _parse_proforma_values(
-        values_data: List[Dict[str, Any]]
+        values_data: List[Dict[str, Any]],
     ) -> List[ServiceDeskFormFieldValue]:
         """
         Parses a list of values and returns a list of ServiceDeskFormFieldValue objects.
@@ -527,60 +828,66 @@ class ServiceDeskFormParser:
         List[ServiceDeskFormFieldValue]
             A list of ServiceDeskFormFieldValue objects.
         """
-        values = []
-        for value_data in values_data:
-            value = value_data["id"]
-            label = value_data["label"]
-
-            field_value = ServiceDeskFormFieldValue(
-                value=value, label=label, selected=None, children=None
-            )
-            values.append(field_value)
-        return values
+        make = ServiceDeskFormFieldValue._make
+        return [
+            make(_intern(value_data["id"]), _intern(value_data["label"]), None)
+            for value_data in values_data
+        ]
 
     @staticmethod
     def _parse_values(
-        values_data: List[Dict[str, Any]], parent_field_id: str = ""
+        values_data: List[Dict[str, Any]],
     ) -> List[ServiceDeskFormFieldValue]:
         """
-        Parses a list of values and returns a list of ServiceDeskFormFieldValue objects.
+        Parses a list of values, including nested children, and returns a list of
+        ServiceDeskFormFieldValue objects.
+
+        Flat lists, the common case for select and radio fields, are built with a
+        single comprehension. Nested values are walked with an explicit worklist
+        rather than recursion: each value is created once and attached to its
+        parent in order.
 
         Parameters
         ----------
         values_data : List[Dict[str, Any]]
             The JSON data for a list of values.
-        parent_field_id : str, optional
-            The ID of the parent field, used to generate subfield IDs.
 
         Returns
         -------
         List[ServiceDeskFormFieldValue]
             A list of ServiceDeskFormFieldValue objects.
         """
-        values = []
-        for index, value_data in enumerate(values_data):
-            value = value_data["value"]
-            label = value_data["label"]
-            selected = value_data.get("selected", False)
-
-            children_data = value_data.get("children", [])
-            children = (
-                ServiceDeskFormParser._parse_values(
-                    children_data, f"{parent_field_id}:{index+1}"
+        make = ServiceDeskFormFieldValue._make
+        if not any(value_data.get("children") for value_data in values_data):
+            return [
+                make(
+                    _intern(value_data["value"]),
+                    _intern(value_data["label"]),
+                    value_data.get("selected", False),
                 )
-                if children_data
-                else []
-            )
+                for value_data in values_data
+            ]
+
+        values: List[ServiceDeskFormFieldValue] = []
+        pending = [(values_data, values.append)]
+        while pending:
+            level_data, attach = pending.pop()
+            for value_data in level_data:
+                field_value = make(
+                    _intern(value_data["value"]),
+                    _intern(value_data["label"]),
+                    value_data.get("selected", False),
+                )
+                attach(field_value)
 
-            field_value = ServiceDeskFormFieldValue(
-                value=value, label=label, selected=selected, children=children
-            )
-            values.append(field_value)
+                children_data = value_data.get("children")
+                if children_data:
+                    pending.append((children_data, field_value.add_child))
         return values
 
     @staticmethod
     def _parse_proforma_fields(
-        proforma_data: Dict[str, Any]
+        proforma_data: Dict[str, Any],
     ) -> List[ServiceDeskFormField]:
         """
         Parses Proforma fields and returns a list of ServiceDeskFormField objects.
@@ -597,13 +904,17 @@ class ServiceDeskFormParser:
         """
         fields = []
         questions = proforma_data.get("design", {}).get("questions", {})
+        options_by_field = proforma_data.get("proformaFieldOptions", {}).get(
+            "fields", {}
+        )
+        parse_values = ServiceDeskFormParser._parse_proforma_values
         for question_id, question_data in questions.items():
-            field_type = question_data["type"]
-            field_id = question_data.get("jiraField", question_id)
-            label = question_data["label"]
+            field_type = _intern(question_data["type"])
+            field_id = _intern(question_data.get("jiraField", question_id))
+            label = _intern(question_data["label"])
             description = question_data.get("description", "")
             required = question_data.get("validation", {}).get("rq", False)
-            values = proforma_data["proformaFieldOptions"]["fields"].get(field_id, [])
+            values = options_by_field.get(field_id, ())
 
             field = ServiceDeskFormField(
                 field_type=field_type,
@@ -614,8 +925,8 @@ class ServiceDeskFormParser:
                 description_html="",
                 required=required,
                 displayed=True,
-                preset_values=[],
-                values=ServiceDeskFormParser._parse_proforma_values(values),
+                preset_values=(),
+                values=parse_values(values),
                 is_proforma_field=True,
                 proforma_question_id=question_id,
             )
@@ -639,27 +950,23 @@ class ServiceDeskFormParser:
         List[ServiceDeskFormField]
             A list containing the main field and its subfield.
         """
-        fields = [field]
-
-        if field.field_type == "cascadingselect" and field.values:
-            subfield_id = f"{field.field_id}:1"
-            subfield_label = f"{field.label} (Subfield)"
-            subfield = ServiceDeskFormField(
-                field_type=field.field_type,
-                field_id=subfield_id,
-                field_config_id=field.field_config_id,
-                label=subfield_label,
-                description=field.description,
-                description_html=field.description_html,
-                required=field.required,
-                displayed=field.displayed,
-                preset_values=field.preset_values,
-                values=[],
-                renderer_type=field.renderer_type,
-                auto_complete_url=field.auto_complete_url,
-                depends_on=field.field_id,
-                children=[],
-            )
-            fields.append(subfield)
-
-        return fields
+        if not field.values:
+            return [field]
+
+        subfield = ServiceDeskFormField(
+            field_type=field.field_type,
+            field_id=_intern(field.field_id + ":1"),
+            field_config_id=field.field_config_id,
+            label=_intern(field.label + " (Subfield)"),
+            description=field.description,
+            description_html=field.description_html,
+            required=field.required,
+            displayed=field.displayed,
+            preset_values=field.preset_values,
+            values=[],
+            renderer_type=field.renderer_type,
+            auto_complete_url=field.auto_complete_url,
+            depends_on=field.field_id,
+            children=[],
+        )
+        return [field, subfield]
@@ -1,11 +1,33 @@
 import base64
-from typing import Any, Dict, List
+import copy
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import requests
 from atlassian import Jira, ServiceDesk
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 
+from atlassianforms._compat import json_loads
 from atlassianforms.form.manager import ServiceDeskFormFilled
 
+logger = logging.getLogger(__name__)
+
+# Overrides the JSON defaults of the session for the form-encoded create
+# endpoint; None drops the header from the merged request headers.
+_CREATE_REQUEST_HEADERS = {
+    "Content-Type": "application/x-www-form-urlencoded",
+    "Accept": "application/json",
+    "x-requested-with": None,
+}
+
 
 class ServiceDeskRequestError(Exception):
     """
@@ -51,49 +73,61 @@ class ServiceDeskRequestError(Exception):
         return f"ServiceDeskRequestError: {self.status_code} - {self.error_message}"
 
 
-def remove_disposable_keys(data, disposable_keys):
+def _decode_json(response: requests.Response) -> Any:
     """
-    Recursively removes the disposable keys from a dictionary or list.
+    Decodes the JSON body of a response, with orjson when it is installed.
 
     Parameters
     ----------
-    data : dict or list
-        The JSON data (as a dict or list) from which keys should be removed.
-    disposable_keys : list
-        A list of keys to be removed from the data.
+    response : requests.Response
+        The response to decode.
 
     Returns
     -------
-    dict or list
-        The cleaned-up data with disposable keys removed.
+    Any
+        The decoded JSON body.
     """
-    if isinstance(data, dict):
-        return {
-            k: remove_disposable_keys(v, disposable_keys)
-            for k, v in data.items()
-            if k not in disposable_keys
-        }
-    elif isinstance(data, list):
-        return [remove_disposable_keys(item, disposable_keys) for item in data]
-    else:
-        return data
+    return json_loads(response.content)
 
 
-def clean_response(response):
+def remove_disposable_keys(data, disposable_keys):
     """
-    Cleans up the JSON response by removing unnecessary keys.
+    Removes the disposable keys from a dictionary or list, at any depth.
+
+    The data is walked iteratively and cleaned in place, so no copy of the tree
+    is built; callers that need to keep the original should copy it first.
 
     Parameters
     ----------
-    response : dict
-        The JSON response to clean.
+    data : dict or list
+        The JSON data (as a dict or list) from which keys should be removed.
+    disposable_keys : Iterable[str]
+        The keys to be removed from the data.
 
     Returns
     -------
-    dict
-        The cleaned response.
+    dict or list
+        The cleaned-up data with disposable keys removed.
     """
-    disposable_keys = [
+    if not isinstance(disposable_keys, (set, frozenset)):
+        disposable_keys = frozenset(disposable_keys)
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key in [key for key in node if key in disposable_keys]:
+                del node[key]
+            children = node.values()
+        elif isinstance(node, list):
+            children = node
+        else:
+            continue
+        stack.extend(child for child in children if isinstance(child, (dict, list)))
+    return data
+
+
+_DISPOSABLE_KEYS = frozenset(
+    {
         "key",
         "portalBaseUrl",
         "onlyPortal",
@@ -136,9 +170,72 @@ def clean_response(response):
         "footerPanels",
         "pagePanels",
         "localId",
-    ]
+    }
+)
+
+
+def clean_response(response):
+    """
+    Cleans up the JSON response by removing unnecessary keys.
+
+    Parameters
+    ----------
+    response : dict
+        The JSON response to clean. It is modified in place.
+
+    Returns
+    -------
+    dict
+        The cleaned response.
+    """
+    return remove_disposable_keys(response, _DISPOSABLE_KEYS)
+
 
-    return remove_disposable_keys(response, disposable_keys)
+def _merge_form_options(
+    form_data: Dict, additional_options: Dict, autocomplete_options: List[Dict]
+) -> Dict:
+    """
+    Merges the Proforma and autocomplete options into the fetched form data.
+
+    Parameters
+    ----------
+    form_data : Dict
+        The form data returned by `ServiceDeskManager._fetch_form_data`.
+    additional_options : Dict
+        The Proforma field options.
+    autocomplete_options : List[Dict]
+        The autocomplete options of the form's autocomplete fields.
+
+    Returns
+    -------
+    Dict
+        The same form data, with the options merged in.
+    """
+    req_create = form_data["reqCreate"]
+    req_create["proformaTemplateForm"]["proformaFieldOptions"] = additional_options
+    req_create["autocompleteOptions"] = autocomplete_options
+    return form_data
+
+
+class _CappedRetry(Retry):
+    """
+    A urllib3 `Retry` that honours the Retry-After header but never sleeps longer
+    than `max_retry_after` seconds, the same cap `ServiceDeskManager._post` applies
+    to resent POSTs.
+    """
+
+    max_retry_after = 30.0
+
+    def new(self, **kw: Any) -> "_CappedRetry":
+        retry = super().new(**kw)
+        retry.max_retry_after = self.max_retry_after
+        return retry
+
+    def get_retry_after(self, response: Any) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.max_retry_after)
 
 
 class ServiceDeskManager:
@@ -158,6 +255,32 @@ class ServiceDeskManager:
         An instance of the Atlassian ServiceDesk client.
     jira : Jira
         An instance of the Atlassian Jira client.
+    session : requests.Session
+        The HTTP session, with pooled connections, used for all API calls.
+    cloud_id : str
+        The cloud ID of the tenant, fetched once on first access.
+    AUTOCOMPLETE_MAX_WORKERS : int
+        The maximum number of autocomplete lookups issued concurrently.
+    POOL_CONNECTIONS : int
+        The number of per-host connection pools kept by the session.
+    POOL_MAXSIZE : int
+        The maximum number of connections kept in each pool.
+    FORM_CACHE_TTL : float
+        The number of seconds the Proforma and autocomplete options of a fetched
+        form are reused. Caching is off by default (0).
+    PROFORMA_CACHE_TTL : float
+        The number of seconds fetched Proforma options are reused. Caching is off
+        by default (0).
+    PROFORMA_CACHE_MAXSIZE : int
+        The maximum number of request types whose Proforma options are cached; the
+        least recently used entry is evicted first.
+    RATE_LIMIT_MAX_RETRIES : int
+        How many times a rate-limited (429) POST is resent.
+    RATE_LIMIT_BACKOFF : float
+        The base delay, in seconds, between resends when no Retry-After is given.
+    RATE_LIMIT_MAX_DELAY : float
+        The longest delay, in seconds, waited before a resend, whatever the
+        Retry-After header asks for.
 
     Methods
     -------
@@ -172,8 +295,25 @@ class ServiceDeskManager:
     create_service_desk_request(request_type: str, reporter_email: str,
                                 field_data: dict, portal_id: str) -> Dict:
         Creates a service desk request with the specified parameters.
+    close() -> None:
+        Closes the pooled connections of the HTTP session.
+    clear_form_cache() -> None:
+        Drops every Proforma and autocomplete option set cached by `fetch_form`.
+    create_requests(forms_filled: List[ServiceDeskFormFilled], max_workers: int = 8)
+                    -> List[Union[Dict, Exception]]:
+        Creates several service desk requests concurrently.
     """
 
+    AUTOCOMPLETE_MAX_WORKERS = 8
+    POOL_CONNECTIONS = 10
+    POOL_MAXSIZE = 20
+    FORM_CACHE_TTL = 0.0
+    PROFORMA_CACHE_TTL = 0.0
+    PROFORMA_CACHE_MAXSIZE = 64
+    RATE_LIMIT_MAX_RETRIES = 3
+    RATE_LIMIT_BACKOFF = 0.5
+    RATE_LIMIT_MAX_DELAY = 30.0
+
     def __init__(self, base_url: str, username: str, auth_token: str):
         """
         Initializes the ServiceDeskManager class with authentication details.
@@ -198,13 +338,89 @@ class ServiceDeskManager:
             "accept": "*/*",
             "content-type": "application/json",
             "x-requested-with": "XMLHttpRequest",
+            # Every compression urllib3 can decode here: gzip and deflate, plus
+            # br/zstd when the brotli/zstandard packages are installed.
+            **make_headers(accept_encoding=True),
         }
         self.all_headers = {**self.default_headers, **self.auth_header}
+        self.session = self._create_session()
+        # (fetched at, (Proforma field options, autocomplete options)) per form.
+        self._form_cache: Dict[
+            Tuple[int, int], Tuple[float, Tuple[Dict, List[Dict]]]
+        ] = {}
+        self._proforma_cache: "OrderedDict[Tuple[int, int], Tuple[float, Dict]]" = (
+            OrderedDict()
+        )
+        self._proforma_cache_lock = threading.Lock()
         self.service_desk = ServiceDesk(
             url=base_url, username=username, password=auth_token
         )
         self.jira = Jira(url=base_url, username=username, password=auth_token)
 
+    def _create_session(self) -> requests.Session:
+        """
+        Creates the HTTP session shared by all requests of this manager, so that
+        connections to the Atlassian host are pooled and reused.
+
+        The session adapter retries idempotent requests on rate limiting and
+        transient server errors, waiting at most `RATE_LIMIT_MAX_DELAY` seconds
+        whatever the Retry-After header asks for. It never retries POSTs; those
+        are only resent on a 429 answer, by `_post`.
+
+        Returns
+        -------
+        requests.Session
+            A session carrying the default and authentication headers.
+        """
+        session = requests.Session()
+        session.headers.update(self.all_headers)
+        retry = _CappedRetry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False,
+        )
+        retry.max_retry_after = self.RATE_LIMIT_MAX_DELAY
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=retry,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self) -> None:
+        """
+        Closes the pooled connections of the HTTP session.
+        """
+        self.session.close()
+
+    def __enter__(self) -> "ServiceDeskManager":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @cached_property
+    def cloud_id(self) -> str:
+        """
+        The cloud ID of the Atlassian tenant, fetched on first access.
+
+        Returns
+        -------
+        str
+            The tenant cloud ID.
+
+        Raises
+        ------
+        requests.exceptions.HTTPError
+            If the tenant info request fails. Failures are not cached.
+        """
+        tenant_info_response = self.session.get(f"{self.base_url}/_edge/tenant_info")
+        tenant_info_response.raise_for_status()
+        return _decode_json(tenant_info_response)["cloudId"]
+
     def get_service_desks(self) -> List[Dict]:
         """
         Fetches and returns all service desk projects.
@@ -252,16 +468,70 @@ class ServiceDeskManager:
         -------
         Dict
             The cleaned JSON response containing the fields, parameters, and additional options.
+
+        Notes
+        -----
+        When `FORM_CACHE_TTL` is positive, the Proforma and autocomplete options
+        are cached per `(portal_id, request_type_id)` for that many seconds. The
+        form model, which carries the XSRF token, is always fetched again, so a
+        cached token is never reused. Each call returns its own copy.
         """
-        form_data = self._fetch_form_data(portal_id, request_type_id)
-        additional_options = self._fetch_proforma_options(portal_id, request_type_id)
-        autocomplete_options = self._fetch_autocomplete_options(form_data)
-        form_data["reqCreate"]["proformaTemplateForm"][
-            "proformaFieldOptions"
-        ] = additional_options
-        form_data["reqCreate"]["autocompleteOptions"] = autocomplete_options
+        key = (portal_id, request_type_id)
+        now = time.monotonic()
+        cached = self._form_cache.get(key)
+        if cached is not None and now - cached[0] < self.FORM_CACHE_TTL:
+            form_data = self._fetch_form_data(portal_id, request_type_id)
+            additional_options, autocomplete_options = copy.deepcopy(cached[1])
+            return _merge_form_options(
+                form_data, additional_options, autocomplete_options
+            )
+
+        form_data = self._fetch_form_uncached(portal_id, request_type_id)
+        if self.FORM_CACHE_TTL > 0:
+            req_create = form_data["reqCreate"]
+            options = (
+                req_create["proformaTemplateForm"]["proformaFieldOptions"],
+                req_create["autocompleteOptions"],
+            )
+            self._form_cache[key] = (now, copy.deepcopy(options))
         return form_data
 
+    def clear_form_cache(self) -> None:
+        """
+        Drops every cached Proforma and autocomplete option set, so the next
+        `fetch_form` calls fetch them from the API again.
+        """
+        self._form_cache.clear()
+        self._proforma_cache.clear()
+
+    def _fetch_form_uncached(self, portal_id: int, request_type_id: int) -> Dict:
+        """
+        Fetches the form model, its Proforma options and its autocomplete options.
+
+        Parameters
+        ----------
+        portal_id : int
+            The ID of the service desk project (portalId).
+        request_type_id : int
+            The ID of the request type.
+
+        Returns
+        -------
+        Dict
+            The cleaned form data with the additional options merged in.
+        """
+        # The proforma options do not depend on the form model, so they are
+        # fetched in the background while the model and its autocomplete
+        # options are loaded.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            proforma_options = executor.submit(
+                self._fetch_proforma_options, portal_id, request_type_id
+            )
+            form_data = self._fetch_form_data(portal_id, request_type_id)
+            autocomplete_options = self._fetch_autocomplete_options(form_data)
+            additional_options = proforma_options.result()
+        return _merge_form_options(form_data, additional_options, autocomplete_options)
+
     def _fetch_form_data(self, portal_id: int, request_type_id: int) -> Dict:
         """
         Fetches the form data for the specified service desk request type.
@@ -279,7 +549,6 @@ class ServiceDeskManager:
             The JSON response containing the fields and parameters.
         """
         url = f"{self.base_url}/rest/servicedesk/1/customer/models"
-        headers = self.all_headers
         body = {
             "options": {
                 "portalWebFragments": {
@@ -297,11 +566,15 @@ class ServiceDeskManager:
                 "clientBasePath": f"{self.base_url}/servicedesk/customer",
             },
         }
-        response = requests.post(url, headers=headers, json=body)
+        response = self.session.post(url, json=body)
         response.raise_for_status()
 
         return clean_response(
-            {**response.json(), "portalId": portal_id, "requestTypeId": request_type_id}
+            {
+                **_decode_json(response),
+                "portalId": portal_id,
+                "requestTypeId": request_type_id,
+            }
         )
 
     def _fetch_proforma_options(self, portal_id: int, request_type_id: int) -> Dict:
@@ -319,81 +592,140 @@ class ServiceDeskManager:
         -------
         Dict
             A dictionary containing the additional Proforma field options.
+
+        Notes
+        -----
+        When `PROFORMA_CACHE_TTL` is positive, successful responses are cached per
+        `(portal_id, request_type_id)` for that many seconds, independently of the
+        form cache TTL. At most `PROFORMA_CACHE_MAXSIZE` entries are kept.
         """
+        key = (portal_id, request_type_id)
+        now = time.monotonic()
+        with self._proforma_cache_lock:
+            cached = self._proforma_cache.get(key)
+            if cached is not None and now - cached[0] < self.PROFORMA_CACHE_TTL:
+                self._proforma_cache.move_to_end(key)
+                return copy.deepcopy(cached[1])
+
         try:
-            headers = self.all_headers
-            tenant_info_url = f"{self.base_url}/_edge/tenant_info"
-            tenant_info_response = requests.get(tenant_info_url, headers=headers)
-            tenant_info_response.raise_for_status()
-            cloud_id = tenant_info_response.json()["cloudId"]
-
-            form_choices_url = f"{self.base_url}/gateway/api/proforma/portal/cloudid/{cloud_id}/api/3/portal/{portal_id}/requesttype/{request_type_id}/formchoices"
-            form_choices_response = requests.get(form_choices_url, headers=headers)
+            form_choices_url = f"{self.base_url}/gateway/api/proforma/portal/cloudid/{self.cloud_id}/api/3/portal/{portal_id}/requesttype/{request_type_id}/formchoices"
+            form_choices_response = self.session.get(form_choices_url)
             form_choices_response.raise_for_status()
-        except requests.exceptions.HTTPError as e:
+        except requests.exceptions.HTTPError:
             return {}
-        return form_choices_response.json()
+        proforma_options = _decode_json(form_choices_response)
+        if self.PROFORMA_CACHE_TTL > 0:
+            with self._proforma_cache_lock:
+                self._proforma_cache[key] = (now, copy.deepcopy(proforma_options))
+                self._proforma_cache.move_to_end(key)
+                while len(self._proforma_cache) > self.PROFORMA_CACHE_MAXSIZE:
+                    self._proforma_cache.popitem(last=False)
+        return proforma_options
 
     def _fetch_autocomplete_options(self, form_data: dict) -> List[Dict[Any, Any]]:
         """
-        Fetches autocomplete options for a specific field in a service desk request form.
+        Fetches the autocomplete options of every autocomplete field in a service
+        desk request form.
 
         Parameters
         ----------
-        portal_id : int
-            The ID of the service desk project (portalId).
-        request_id : int
-            The ID of the specific service desk request.
-        customfield_id : str
-            The ID of the custom field for which autocomplete options are being fetched.
+        form_data : dict
+            The form data returned by `_fetch_form_data`.
 
         Returns
         -------
-        Dict
-            A dictionary containing the autocomplete options for the specified custom field.
+        List[Dict[Any, Any]]
+            The autocomplete options of each autocomplete field, in field order.
         """
         # TODO: discover how to paginate the request, since there is a hasNextPage field in the response
         portal_id = form_data["portalId"]
         request_id = form_data["reqCreate"]["id"]
-        field_map = {"fieldValueMap": {}, "query": ""}
-        field_map_values = {
-            field["fieldId"]: "" for field in form_data["reqCreate"]["fields"]
-        }
-        field_map["fieldValueMap"] = field_map_values
+        fields = form_data["reqCreate"]["fields"]
         autocomplete_fields = [
             field
-            for field in form_data["reqCreate"]["fields"]
+            for field in fields
             if field.get("autoCompleteUrl", "")
             and field.get("fieldType") != "organisationpicker"
         ]
-        additional_options = []
-        for field in autocomplete_fields:
-            customfield_id = field["fieldId"]
-            try:
-                headers = self.all_headers
-                autocomplete_url = f"{self.base_url}/rest/servicedesk/cmdb/1/customer/portal/{portal_id}/request/{request_id}/field/{customfield_id}/autocomplete"
-                response = requests.post(
-                    autocomplete_url, headers=headers, json=field_map
+        if not autocomplete_fields:
+            return []
+
+        # Every lookup sends the same body, so it is encoded once up front.
+        field_map = json.dumps(
+            {"fieldValueMap": {field["fieldId"]: "" for field in fields}, "query": ""},
+            allow_nan=False,
+        ).encode("utf-8")
+        if len(autocomplete_fields) == 1:
+            return [
+                self._fetch_field_autocomplete_options(
+                    portal_id, request_id, field, field_map
                 )
-                response.raise_for_status()
-                response_dict = response.json()
-            except requests.exceptions.HTTPError as e:
-                print(
-                    f"Failed to fetch autocomplete options for field {customfield_id}: {e}"
+                for field in autocomplete_fields
+            ]
+
+        # The lookups are independent and I/O bound, so they are issued
+        # concurrently; map() keeps the results in field order.
+        max_workers = min(len(autocomplete_fields), self.AUTOCOMPLETE_MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda field: self._fetch_field_autocomplete_options(
+                        portal_id, request_id, field, field_map
+                    ),
+                    autocomplete_fields,
                 )
-                response_dict = {}
-            response_dict = {
-                **response_dict,
-                "fieldId": customfield_id,
-                "fieldType": field.get("fieldType", ""),
-                "fieldLabel": field.get("label", ""),
-                "fieldDescription": field.get("description", ""),
-                "fieldRequired": field.get("required", ""),
-                "fieldDisplayed": field.get("displayed", ""),
-                "fieldPresetValues": field.get("presetValues", ""),
-            }
-            additional_options.append(response_dict)
-        return additional_options
+            )
+
+    def _fetch_field_autocomplete_options(
+        self,
+        portal_id: int,
+        request_id: int,
+        field: Dict[str, Any],
+        field_map: bytes,
+    ) -> Dict[Any, Any]:
+        """
+        Fetches the autocomplete options of a single field.
+
+        Parameters
+        ----------
+        portal_id : int
+            The ID of the service desk project (portalId).
+        request_id : int
+            The ID of the specific service desk request.
+        field : Dict[str, Any]
+            The JSON data of the autocomplete field.
+        field_map : bytes
+            The JSON encoded request body sent to the autocomplete endpoint.
+
+        Returns
+        -------
+        Dict[Any, Any]
+            The autocomplete response merged with the field details. The response
+            part is empty if the request failed.
+        """
+        customfield_id = field["fieldId"]
+        try:
+            autocomplete_url = f"{self.base_url}/rest/servicedesk/cmdb/1/customer/portal/{portal_id}/request/{request_id}/field/{customfield_id}/autocomplete"
+            response = self._post(autocomplete_url, data=field_map)
+            response.raise_for_status()
+            response_dict = _decode_json(response)
+        except requests.exceptions.HTTPError as e:
+            logger.warning(
+                "Failed to fetch autocomplete options for field %s: status %s",
+                customfield_id,
+                getattr(e.response, "status_code", None),
+            )
+            response_dict = {}
+        return {
+            **response_dict,
+            "fieldId": customfield_id,
+            "fieldType": field.get("fieldType", ""),
+            "fieldLabel": field.get("label", ""),
+            "fieldDescription": field.get("description", ""),
+            "fieldRequired": field.get("required", ""),
+            "fieldDisplayed": field.get("displayed", ""),
+            "fieldPresetValues": field.get("presetValues", ""),
+        }
 
     def create_request(self, form_filled: ServiceDeskFormFilled) -> Dict:
         """
@@ -410,6 +742,12 @@ class ServiceDeskManager:
         -------
         Dict
             The response from the API after creating the request.
+
+        Notes
+        -----
+        A rate-limited (429) answer means the request was not created, so the POST
+        is resent up to `RATE_LIMIT_MAX_RETRIES` times, waiting at most
+        `RATE_LIMIT_MAX_DELAY` seconds between attempts.
         """
         field_data = form_filled.to_request_payload()
 
@@ -417,16 +755,101 @@ class ServiceDeskManager:
         request_type_id = form_filled.form.request_type_id
 
         url = f"{self.base_url}/servicedesk/customer/portal/{portal_id}/create/{request_type_id}"
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Accept": "application/json",
-            **self.auth_header,
-        }
-
-        params = requests.models.RequestEncodingMixin._encode_params(field_data)
-        response = requests.post(url, headers=headers, data=params)
+        # to_request_payload() already returns the url-encoded form body.
+        response = self._post(
+            url, headers=_CREATE_REQUEST_HEADERS, data=field_data.encode("ascii")
+        )
 
         if response.status_code in (201, 200):
-            return response.json()
+            return _decode_json(response)
+        raise ServiceDeskRequestError(response.status_code, response.text)
+
+    def create_requests(
+        self,
+        forms_filled: List[ServiceDeskFormFilled],
+        max_workers: int = 8,
+    ) -> List[Union[Dict, Exception]]:
+        """
+        Creates several service desk requests concurrently.
+
+        Parameters
+        ----------
+        forms_filled : List[ServiceDeskFormFilled]
+            The filled forms to submit.
+        max_workers : int, optional
+            The maximum number of requests in flight at once, by default 8.
+
+        Returns
+        -------
+        List[Union[Dict, Exception]]
+            One entry per form, in input order: the API response of the created
+            request, or the exception raised while building or sending it (for
+            example a `ServiceDeskRequestError`, a
+            `requests.exceptions.RequestException` or a `ValueError` from an
+            invalid payload). A failing form never aborts the rest of the batch.
+        """
+
+        def create(form_filled: ServiceDeskFormFilled) -> Union[Dict, Exception]:
+            try:
+                return self.create_request(form_filled)
+            except Exception as e:
+                return e
+
+        if not forms_filled:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=min(len(forms_filled), max_workers)
+        ) as executor:
+            return list(executor.map(create, forms_filled))
+
+    def _post(self, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Sends a POST through the session, resending it while it is rate limited.
+
+        The session adapter only retries idempotent methods; a 429 answer means
+        the POST was not processed, so it is safe to resend as well.
+
+        Parameters
+        ----------
+        url : str
+            The URL to post to.
+        **kwargs : Any
+            Keyword arguments forwarded to `requests.Session.post`.
+
+        Returns
+        -------
+        requests.Response
+            The first response that is not a 429, or the last 429 once
+            `RATE_LIMIT_MAX_RETRIES` resends have been made.
+        """
+        for attempt in range(self.RATE_LIMIT_MAX_RETRIES):
+            response = self.session.post(url, **kwargs)
+            if response.status_code != 429:
+                return response
+            time.sleep(self._retry_delay(response, attempt))
+        return self.session.post(url, **kwargs)
+
+    def _retry_delay(self, response: requests.Response, attempt: int) -> float:
+        """
+        Computes how long to wait before resending a rate-limited request.
+
+        Parameters
+        ----------
+        response : requests.Response
+            The 429 response.
+        attempt : int
+            The zero-based number of the attempt that was rate limited.
+
+        Returns
+        -------
+        float
+            The number of seconds from the Retry-After header when it is given in
+            seconds, otherwise an exponential backoff; never more than
+            `RATE_LIMIT_MAX_DELAY`.
+        """
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            delay = float(retry_after)
         else:
-            raise ServiceDeskRequestError(response.status_code, response.text)
+            delay = self.RATE_LIMIT_BACKOFF * 2**attempt
+        return min(delay, self.RATE_LIMIT_MAX_DELAY)
@@ -1,8 +1,10 @@
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
+from atlassianforms._compat import DATACLASS_SLOTS, _intern
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class Reporter:
     email: str
     display_name: str
@@ -10,14 +12,14 @@ class Reporter:
     account_id: str
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class IssueField:
     id: str
     label: str
     value: Dict
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Issue:
     id: int
     key: str
@@ -44,7 +46,7 @@ class Issue:
     form_key: str = ""
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CreateRequestResponse:
     reporter: Reporter
     request_type_name: str
@@ -91,18 +93,19 @@ class CreateRequestResponseParser:
         """
         reporter = CreateRequestResponseParser._parse_reporter(data["reporter"])
         issue = CreateRequestResponseParser._parse_issue(data["issue"])
+        get = data.get
 
         return CreateRequestResponse(
             reporter=reporter,
-            request_type_name=data.get("requestTypeName", ""),
-            key=data.get("key", ""),
-            issue_type=data.get("issueType", ""),
-            issue_type_name=data.get("issueTypeName", ""),
+            request_type_name=get("requestTypeName", ""),
+            key=get("key", ""),
+            issue_type=get("issueType", ""),
+            issue_type_name=get("issueTypeName", ""),
             issue=issue,
-            can_create_issues=data.get("canCreateIssues", False),
-            can_add_comment=data.get("canAddComment", False),
-            issue_link_url=data.get("issueLinkUrl", ""),
-            request_details_base_url=data.get("requestDetailsBaseUrl", ""),
+            can_create_issues=get("canCreateIssues", False),
+            can_add_comment=get("canAddComment", False),
+            issue_link_url=get("issueLinkUrl", ""),
+            request_details_base_url=get("requestDetailsBaseUrl", ""),
         )
 
     @staticmethod
@@ -120,11 +123,12 @@ class CreateRequestResponseParser:
         Reporter
             The parsed Reporter object.
         """
+        get = reporter_data.get
         return Reporter(
-            email=reporter_data.get("email", ""),
-            display_name=reporter_data.get("displayName", ""),
-            avatar_url=reporter_data.get("avatarUrl", ""),
-            account_id=reporter_data.get("accountId", ""),
+            email=get("email", ""),
+            display_name=get("displayName", ""),
+            avatar_url=get("avatarUrl", ""),
+            account_id=get("accountId", ""),
         )
 
     @staticmethod
@@ -143,7 +147,7 @@ class CreateRequestResponseParser:
             The parsed IssueField object.
         """
         return IssueField(
-            id=field_data.get("id", ""),
+            id=_intern(field_data.get("id", "")),
             label=field_data.get("label", ""),
             value=field_data.get("value", {}),
         )
@@ -164,33 +168,32 @@ class CreateRequestResponseParser:
             The parsed Issue object.
         """
         reporter = CreateRequestResponseParser._parse_reporter(issue_data["reporter"])
-        fields = [
-            CreateRequestResponseParser._parse_issue_field(f)
-            for f in issue_data.get("fields", [])
-        ]
+        get = issue_data.get
+        parse_issue_field = CreateRequestResponseParser._parse_issue_field
+        fields = [parse_issue_field(f) for f in get("fields", ())]
 
         return Issue(
-            id=issue_data.get("id", 0),
-            key=issue_data.get("key", ""),
+            id=get("id", 0),
+            key=get("key", ""),
             reporter=reporter,
-            participants=issue_data.get("participants", []),
-            organisations=issue_data.get("organisations", []),
-            sequence=issue_data.get("sequence", 0),
-            service_desk_key=issue_data.get("serviceDeskKey", ""),
-            request_type_name=issue_data.get("requestTypeName", ""),
-            request_type_id=issue_data.get("requestTypeId", 0),
-            summary=issue_data.get("summary", ""),
-            is_new=issue_data.get("isNew", False),
-            status=issue_data.get("status", ""),
-            date=issue_data.get("date", ""),
-            friendly_date=issue_data.get("friendlyDate", ""),
+            participants=get("participants") or [],
+            organisations=get("organisations") or [],
+            sequence=get("sequence", 0),
+            service_desk_key=get("serviceDeskKey", ""),
+            request_type_name=get("requestTypeName", ""),
+            request_type_id=get("requestTypeId", 0),
+            summary=get("summary", ""),
+            is_new=get("isNew", False),
+            status=get("status", ""),
+            date=get("date", ""),
+            friendly_date=get("friendlyDate", ""),
             fields=fields,
-            activity_stream=issue_data.get("activityStream", []),
-            request_icon=issue_data.get("requestIcon", 0),
-            icon_url=issue_data.get("iconUrl", ""),
-            can_browse=issue_data.get("canBrowse", True),
-            can_attach=issue_data.get("canAttach", True),
-            category_key=issue_data.get("categoryKey", ""),
-            creator_account_id=issue_data.get("creatorAccountId", ""),
-            form_key=issue_data.get("formKey", ""),
+            activity_stream=get("activityStream") or [],
+            request_icon=get("requestIcon", 0),
+            icon_url=get("iconUrl", ""),
+            can_browse=get("canBrowse", True),
+            can_attach=get("canAttach", True),
+            category_key=get("categoryKey", ""),
+            creator_account_id=get("creatorAccountId", ""),
+            form_key=get("formKey", ""),
         )
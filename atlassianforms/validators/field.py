@@ -1,12 +1,14 @@
 import json
+import re
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, ClassVar, Collection, Dict, Iterable, Optional
 
-from atlassianforms.form.parser import (
-    ServiceDeskForm,
-    ServiceDeskFormField,
-    ServiceDeskFormFieldValue,
-)
+from atlassianforms._compat import json_loads
+from atlassianforms.form.parser import ServiceDeskForm, ServiceDeskFormField
+
+# Same shape as strptime's "%Y-%m-%dT%H:%M" (which also accepts unpadded
+# components and a lowercase "t"); the calendar check is left to datetime().
+_DT_PATTERN = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})[Tt](\d{1,2}):(\d{1,2})")
 
 
 class ServiceDeskFormValidator:
@@ -17,17 +19,21 @@ class ServiceDeskFormValidator:
     -------
     validate(filled_values: Dict[str, Any], form: ServiceDeskForm) -> None:
         Validates all filled values based on the form's field definitions.
+    validate_many(batch: Iterable[Dict[str, Any]], form: ServiceDeskForm) -> None:
+        Validates several sets of filled values against the same form.
     _validate_dt_field(field: ServiceDeskFormField, value: str) -> None:
         Validates a date-time string for a field.
     _validate_choice_field(field: ServiceDeskFormField, value: Any) -> None:
         Validates a choice field, handling both single and compound fields.
+    _validate_multichoice_field(field: ServiceDeskFormField, value: Any) -> None:
+        Validates the selected values of a multiselect field.
     _validate_text_field(field: ServiceDeskFormField, value: str) -> None:
         Validates a text field.
     _validate_adf_field(field: ServiceDeskFormField, value: str) -> None:
         Validates an Atlassian Document Format (ADF) field.
     _validate_dt(value: str) -> bool:
         Checks if the date-time string is valid.
-    _validate_choice(value: str, choices: List[str]) -> bool:
+    _validate_choice(value: str, choices: Collection[str]) -> bool:
         Checks if the value is within allowed choices.
     _validate_text(value: str, max_length: Optional[int] = None) -> bool:
         Checks if the text is valid, optionally validating length.
@@ -52,22 +58,50 @@ class ServiceDeskFormValidator:
             If any field value is invalid according to its type.
         """
         for field_identifier, value in filled_values.items():
-            # Check if this is a derived field (e.g., customfield_10118:1)
-            field = self._get_field_by_id_or_label(form, field_identifier)
+            # A subfield of a cascading select (e.g., customfield_10118:1) is
+            # checked against its main field, so only the main field is looked up.
+            key, separator, _ = field_identifier.partition(":")
+            field = self._get_field_by_id_or_label(form, key)
 
             if not field:
                 raise ValueError(f"Field '{field_identifier}' not found in the form.")
 
-            if ":" in field_identifier:  # This is a subfield in a cascading select
+            if separator:
                 self._validate_cascading_subfield(
-                    form, filled_values, field_identifier, value
+                    field, key, filled_values, field_identifier, value
                 )
             else:
                 self._validate_generic_field(field, value)
 
+    def validate_many(
+        self, batch: Iterable[Dict[str, Any]], form: ServiceDeskForm
+    ) -> None:
+        """
+        Validates several sets of filled values against the same form.
+
+        The form's field index and choice sets are built on first use and reused
+        for every entry of the batch.
+
+        Parameters
+        ----------
+        batch : Iterable[Dict[str, Any]]
+            The dictionaries of filled field values to validate.
+        form : ServiceDeskForm
+            The form object containing field definitions.
+
+        Raises
+        ------
+        ValueError
+            If any field value of any entry is invalid according to its type.
+        """
+        validate = self.validate
+        for filled_values in batch:
+            validate(filled_values, form)
+
     def _validate_cascading_subfield(
         self,
-        form: ServiceDeskForm,
+        main_field: ServiceDeskFormField,
+        main_field_id: str,
         filled_values: Dict[str, Any],
         field_identifier: str,
         value: str,
@@ -77,8 +111,10 @@ class ServiceDeskFormValidator:
 
         Parameters
         ----------
-        form : ServiceDeskForm
-            The form containing the fields.
+        main_field : ServiceDeskFormField
+            The cascading select field the subfield belongs to.
+        main_field_id : str
+            The identifier of the main field, as used in the filled values.
         filled_values : Dict[str, Any]
             The dictionary of filled field values to validate.
         field_identifier : str
@@ -91,15 +127,6 @@ class ServiceDeskFormValidator:
         ValueError
             If the main field or subfield value is invalid.
         """
-        # Extract the main field ID
-        main_field_id = field_identifier.split(":")[0]
-        main_field = self._get_field_by_id_or_label(form, main_field_id)
-
-        if not main_field:
-            raise ValueError(
-                f"Main field '{main_field_id}' for subfield '{field_identifier}' not found in the form."
-            )
-
         # Validate that the main field's value is set correctly
         main_field_value = filled_values.get(main_field_id)
         if not main_field_value:
@@ -107,18 +134,14 @@ class ServiceDeskFormValidator:
                 f"Main field '{main_field.label}' with ID '{main_field_id}' is not set, but subfield '{field_identifier}' is provided."
             )
 
-        main_value_obj = self._get_value_by_label_or_id(
-            main_field.values, main_field_value
-        )
+        main_value_obj = main_field.get_value(main_field_value)
         if not main_value_obj:
             raise ValueError(
                 f"Invalid main field value '{main_field_value}' for field '{main_field.label}' or '{main_field.field_id}'."
             )
 
         # Validate the subfield value
-        subfield_value_obj = self._get_value_by_label_or_id(
-            main_value_obj.children, value
-        )
+        subfield_value_obj = main_value_obj.get_child(value)
         if not subfield_value_obj:
             available_subfields = [child.label for child in main_value_obj.children]
             raise ValueError(
@@ -142,26 +165,9 @@ class ServiceDeskFormValidator:
         ValueError
             If the value is not valid for the field.
         """
-        if field.field_type == "dt":
-            if not self._validate_dt(value):
-                raise ValueError(
-                    f"Invalid date-time value '{value}' for field '{field.label}' or '{field.field_id}'."
-                )
-        elif field.field_type in ["select", "radiobuttons", "multiselect"]:
-            if not self._validate_choice(value, [v.value for v in field.values]):
-                raise ValueError(
-                    f"Invalid choice value '{value}' for field '{field.label}' or '{field.field_id}'."
-                )
-        elif field.field_type in ["textarea", "text"]:
-            if not self._validate_text(value):
-                raise ValueError(
-                    f"Invalid text value '{value}' for field '{field.label}' or '{field.field_id}'."
-                )
-        elif field.field_type == "adf":
-            if not self._validate_adf(value):
-                raise ValueError(
-                    f"Invalid ADF value '{value}' for field '{field.label}' or '{field.field_id}'."
-                )
+        handler = self._FIELD_VALIDATORS.get(field.field_type)
+        if handler is not None:
+            handler(self, field, value)
 
     def _validate_dt_field(self, field: ServiceDeskFormField, value: str) -> None:
         """
@@ -200,29 +206,11 @@ class ServiceDeskFormValidator:
         ValueError
             If the value is not a valid choice.
         """
-        if not self._validate_choice(value, [v.value for v in field.values]):
+        if not self._validate_choice(value, field.get_choice_values()):
             raise ValueError(
                 f"Invalid choice value '{value}' for field '{field.label}' or '{field.field_id}'."
             )
 
-    def _validate_choice(self, value: str, choices: List[str]) -> bool:
-        """
-        Validates that a value is within a list of allowed choices.
-
-        Parameters
-        ----------
-        value : str
-            The value to validate.
-        choices : List[str]
-            The list of valid choices.
-
-        Returns
-        -------
-        bool
-            True if the value is within the allowed choices; False otherwise.
-        """
-        return value in choices
-
     def _validate_text_field(self, field: ServiceDeskFormField, value: str) -> None:
         """
         Validates a text field.
@@ -279,13 +267,47 @@ class ServiceDeskFormValidator:
         bool
             True if the value is a valid date-time string; False otherwise.
         """
+        match = _DT_PATTERN.fullmatch(value)
+        if match is None:
+            return False
+        year, month, day, hour, minute = map(int, match.groups())
         try:
-            datetime.strptime(value, "%Y-%m-%dT%H:%M")
-            return True
+            datetime(year, month, day, hour, minute)
         except ValueError:
             return False
+        return True
+
+    def _validate_multichoice_field(
+        self, field: ServiceDeskFormField, value: Any
+    ) -> None:
+        """
+        Validates that every selected value is a valid choice for a multiselect field.
+
+        Parameters
+        ----------
+        field : ServiceDeskFormField
+            The field object.
+        value : Any
+            The selected value, or a list, tuple or set of selected values.
+
+        Raises
+        ------
+        ValueError
+            If any selected value is not a valid choice.
+        """
+        selected = (
+            value if isinstance(value, (list, tuple, set, frozenset)) else (value,)
+        )
+        try:
+            valid = field.get_choice_values().issuperset(selected)
+        except TypeError:
+            valid = False
+        if not valid:
+            raise ValueError(
+                f"Invalid choice value '{value}' for field '{field.label}' or '{field.field_id}'."
+            )
 
-    def _validate_choice(self, value: str, choices: List[str]) -> bool:
+    def _validate_choice(self, value: str, choices: Collection[str]) -> bool:
         """
         Checks if the value is within allowed choices.
 
@@ -293,15 +315,19 @@ class ServiceDeskFormValidator:
         ----------
         value : str
             The value to validate.
-        choices : List[str]
-            The list of valid choices.
+        choices : Collection[str]
+            The valid choices, usually the field's cached frozenset.
 
         Returns
         -------
         bool
             True if the value is within the allowed choices; False otherwise.
         """
-        return value in choices
+        try:
+            return value in choices
+        except TypeError:
+            # Unhashable values (e.g. a list) cannot be one of the set's choices.
+            return False
 
     def _validate_text(self, value: str, max_length: Optional[int] = None) -> bool:
         """
@@ -319,9 +345,9 @@ class ServiceDeskFormValidator:
         bool
             True if the text is valid; False otherwise.
         """
-        if max_length is not None and len(value) > max_length:
+        if not isinstance(value, str):
             return False
-        return isinstance(value, str)
+        return max_length is None or len(value) <= max_length
 
     def _validate_adf(self, value: str) -> bool:
         """
@@ -337,13 +363,15 @@ class ServiceDeskFormValidator:
         bool
             True if the value is a valid ADF string; False otherwise.
         """
-        try:
-            adf = json.loads(value)
-            if adf.get("type") == "doc" and isinstance(adf.get("content"), list):
-                return True
+        # Only a JSON object can be an ADF document, so anything else is
+        # rejected without being parsed.
+        if not isinstance(value, str) or not value.lstrip().startswith("{"):
             return False
-        except json.JSONDecodeError:
+        try:
+            adf = json_loads(value)
+        except json.JSONDecodeError:  # orjson's decode error subclasses it
             return False
+        return adf.get("type") == "doc" and type(adf.get("content")) is list
 
     def _get_field_by_id_or_label(
         self, form: ServiceDeskForm, identifier: str
@@ -363,38 +391,15 @@ class ServiceDeskFormValidator:
         Optional[ServiceDeskFormField]
             The ServiceDeskFormField instance if found, None otherwise.
         """
-        return next(
-            (
-                field
-                for field in form.fields
-                if field.field_id == identifier or field.label == identifier
-            ),
-            None,
-        )
-
-    def _get_value_by_label_or_id(
-        self, values: List[ServiceDeskFormFieldValue], identifier: str
-    ) -> Optional[ServiceDeskFormFieldValue]:
-        """
-        Retrieves a value by its label or ID from a list of ServiceDeskFormFieldValue instances.
-
-        Parameters
-        ----------
-        values : List[ServiceDeskFormFieldValue]
-            The list of ServiceDeskFormFieldValue instances to search.
-        identifier : str
-            The label or ID of the value to retrieve.
-
-        Returns
-        -------
-        Optional[ServiceDeskFormFieldValue]
-            The ServiceDeskFormFieldValue instance if found, None otherwise.
-        """
-        return next(
-            (
-                value
-                for value in values
-                if value.label == identifier or value.value == identifier
-            ),
-            None,
-        )
+        return form.get_field_by_id_or_label(identifier)
+
+    # Field validators by field type; other types are accepted as they are.
+    _FIELD_VALIDATORS: ClassVar[Dict[str, Callable[..., None]]] = {
+        "dt": _validate_dt_field,
+        "select": _validate_choice_field,
+        "radiobuttons": _validate_choice_field,
+        "multiselect": _validate_multichoice_field,
+        "textarea": _validate_text_field,
+        "text": _validate_text_field,
+        "adf": _validate_adf_field,
+    }
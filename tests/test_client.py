@@ -78,12 +78,23 @@ def test_set_form_values_with_fetch(client):
     assert result == {"filled": "form"}
 
 
+def test_set_form_values_many_with_fetch(client):
+    client.form_manager = Mock()
+    client.form_manager.set_field_values_many.return_value = ["filled"]
+    result = client.set_form_values_many([{"field": "value"}])
+    client.form_manager.set_field_values_many.assert_called_once_with(
+        [{"field": "value"}]
+    )
+    assert result == ["filled"]
+
+
 @pytest.mark.parametrize(
     "method,args",
     [
         ("list_fields", []),
         ("list_field_values", ["field_name"]),
         ("set_form_values", [{"field": "value"}]),
+        ("set_form_values_many", [[{"field": "value"}]]),
     ],
 )
 def test_methods_raise_error_without_fetch(client, method, args):
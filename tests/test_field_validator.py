@@ -86,6 +86,16 @@ def test_validate_valid_form(sample_form, validator):
     validator.validate(filled_values, sample_form)  # Should not raise any exception
 
 
+def test_validate_many(sample_form, validator):
+    validator.validate_many(
+        [{"select_field": "option1"}, {"select_field": "option2"}], sample_form
+    )
+    with pytest.raises(ValueError, match="Invalid choice value 'option3'"):
+        validator.validate_many(
+            [{"select_field": "option1"}, {"select_field": "option3"}], sample_form
+        )
+
+
 def test_validate_invalid_date(sample_form, validator):
     filled_values = {"date_field": "invalid-date"}
     with pytest.raises(ValueError, match="Invalid date-time value"):
@@ -98,6 +108,42 @@ def test_validate_invalid_select(sample_form, validator):
         validator.validate(filled_values, sample_form)
 
 
+def test_validate_select_uses_cached_choices(sample_form, validator):
+    select_field = sample_form.fields[1]
+    assert select_field.get_choice_values() == frozenset({"option1", "option2"})
+    assert select_field.get_choice_values() is select_field.get_choice_values()
+
+    validator.validate({"select_field": "option2"}, sample_form)
+    with pytest.raises(ValueError, match="Invalid choice value"):
+        validator.validate({"select_field": ["option1"]}, sample_form)
+
+
+def test_validate_multiselect(sample_form, validator):
+    sample_form.add_field(
+        ServiceDeskFormField(
+            field_type="multiselect",
+            field_id="multi_field",
+            label="Multi Field",
+            required=False,
+            displayed=True,
+            field_config_id="multi_config",
+            description="",
+            description_html="",
+            values=[
+                ServiceDeskFormFieldValue(value="a", label="A"),
+                ServiceDeskFormFieldValue(value="b", label="B"),
+            ],
+        )
+    )
+
+    validator.validate({"multi_field": ["a", "b"]}, sample_form)
+    validator.validate({"multi_field": "a"}, sample_form)
+    with pytest.raises(ValueError, match="Invalid choice value"):
+        validator.validate({"multi_field": ["a", "c"]}, sample_form)
+    with pytest.raises(ValueError, match="Invalid choice value"):
+        validator.validate({"multi_field": [["a"]]}, sample_form)
+
+
 def test_validate_invalid_text(sample_form, validator):
     filled_values = {"text_field": 12345}  # Not a string
     with pytest.raises(ValueError, match="Invalid text value"):
@@ -118,9 +164,54 @@ def test_validate_missing_field(sample_form, validator):
         validator.validate(filled_values, sample_form)
 
 
+def test_validate_cascading_subfield(sample_form, validator):
+    parent = ServiceDeskFormFieldValue(value="parent", label="Parent")
+    parent.add_child(ServiceDeskFormFieldValue(value="child", label="Child"))
+    sample_form.add_field(
+        ServiceDeskFormField(
+            field_type="cascadingselect",
+            field_id="cascading",
+            label="Cascading",
+            required=False,
+            displayed=True,
+            field_config_id="cascading_config",
+            description="",
+            description_html="",
+            values=[parent],
+        )
+    )
+    sample_form.add_field(
+        ServiceDeskFormField(
+            field_type="cascadingselect",
+            field_id="cascading:1",
+            label="Cascading (Subfield)",
+            required=False,
+            displayed=True,
+            field_config_id="cascading_config",
+            description="",
+            description_html="",
+            depends_on="cascading",
+        )
+    )
+
+    validator.validate({"cascading": "Parent", "cascading:1": "child"}, sample_form)
+    with pytest.raises(ValueError, match="Invalid main field value"):
+        validator.validate({"cascading": "other", "cascading:1": "child"}, sample_form)
+    with pytest.raises(ValueError, match="Field 'missing:1' not found in the form"):
+        validator.validate({"missing:1": "child"}, sample_form)
+    with pytest.raises(ValueError, match="Main field 'Cascading' with ID"):
+        validator.validate({"cascading:1": "child"}, sample_form)
+    with pytest.raises(ValueError, match="Invalid subfield value"):
+        validator.validate({"cascading": "parent", "cascading:1": "other"}, sample_form)
+
+
 def test_validate_dt_field(sample_form, validator):
     assert validator._validate_dt("2023-05-15T10:30") == True
     assert validator._validate_dt("invalid-date") == False
+    assert validator._validate_dt("2024-02-29T23:59") == True
+    assert validator._validate_dt("2023-02-29T10:30") == False
+    assert validator._validate_dt("2023-05-15T24:00") == False
+    assert validator._validate_dt("2023-05-15T10:30:00") == False
 
 
 def test_validate_choice_field(sample_form, validator):
@@ -132,6 +223,8 @@ def test_validate_choice_field(sample_form, validator):
 def test_validate_text_field(sample_form, validator):
     assert validator._validate_text("Valid text") == True
     assert validator._validate_text(12345) == False
+    assert validator._validate_text(12345, max_length=10) == False
+    assert validator._validate_text("Valid text", max_length=5) == False
 
 
 def test_validate_adf_field(sample_form, validator):
@@ -139,6 +232,8 @@ def test_validate_adf_field(sample_form, validator):
     invalid_adf = '{"invalid": "json"}'
     assert validator._validate_adf(valid_adf) == True
     assert validator._validate_adf(invalid_adf) == False
+    assert validator._validate_adf('["type", "doc"]') == False
+    assert validator._validate_adf(12345) == False
 
 
 def test_get_field_by_id_or_label(sample_form, validator):
@@ -147,11 +242,11 @@ def test_get_field_by_id_or_label(sample_form, validator):
     assert validator._get_field_by_id_or_label(sample_form, "non_existent") is None
 
 
-def test_get_value_by_label_or_id(sample_form, validator):
-    values = sample_form.fields[1].values  # select_field values
-    assert validator._get_value_by_label_or_id(values, "option1") is not None
-    assert validator._get_value_by_label_or_id(values, "Option 1") is not None
-    assert validator._get_value_by_label_or_id(values, "non_existent") is None
+def test_get_value_by_label_or_id(sample_form):
+    select_field = sample_form.fields[1]
+    assert select_field.get_value("option1") is not None
+    assert select_field.get_value("Option 1") is not None
+    assert select_field.get_value("non_existent") is None
 
 
 if __name__ == "__main__":
@@ -1,5 +1,5 @@
 import json
-import urllib
+import urllib.parse
 from typing import Any, Dict
 
 import pytest
@@ -7,13 +7,30 @@ import pytest
 from atlassianforms.form.manager import (
     ServiceDeskForm,
     ServiceDeskFormField,
-    ServiceDeskFormFieldValue,
     ServiceDeskFormFilled,
     ServiceDeskFormManager,
+    _encode_proforma_data,
+    _quote_value,
 )
+from atlassianforms.form.parser import ServiceDeskFormFieldValue
 from atlassianforms.validators.field import ServiceDeskFormValidator
 
 
+def _make_field(field_type: str, field_id: str, label: str, **kwargs: Any):
+    """Builds a displayed, optional form field without descriptions."""
+    kwargs.setdefault("required", False)
+    return ServiceDeskFormField(
+        field_type=field_type,
+        field_id=field_id,
+        label=label,
+        displayed=True,
+        field_config_id="",
+        description="",
+        description_html="",
+        **kwargs,
+    )
+
+
 @pytest.fixture
 def sample_form():
     return ServiceDeskForm(
@@ -74,6 +91,44 @@ def form_manager(sample_form):
     return ServiceDeskFormManager(sample_form)
 
 
+@pytest.fixture
+def cascading_form_manager(sample_form):
+    cascading_field = ServiceDeskFormField(
+        field_type="cascadingselect",
+        field_id="category",
+        label="Category",
+        required=False,
+        displayed=True,
+        field_config_id="",
+        description="",
+        description_html="",
+        values=[
+            ServiceDeskFormFieldValue(
+                value="1",
+                label="Hardware",
+                children=[
+                    ServiceDeskFormFieldValue(value="11", label="Laptop"),
+                    ServiceDeskFormFieldValue(value="12", label="Monitor"),
+                ],
+            ),
+        ],
+    )
+    subfield = ServiceDeskFormField(
+        field_type="cascadingselect",
+        field_id="category:1",
+        label="Category (Subfield)",
+        required=False,
+        displayed=True,
+        field_config_id="",
+        description="",
+        description_html="",
+        depends_on="category",
+    )
+    sample_form.add_field(cascading_field)
+    sample_form.add_field(subfield)
+    return ServiceDeskFormManager(sample_form)
+
+
 def test_list_fields(form_manager):
     fields = form_manager.list_fields()
     assert len(fields) == 3
@@ -81,6 +136,27 @@ def test_list_fields(form_manager):
     assert fields[1]["id"] == "priority"
     assert fields[2]["description"] == ""
 
+    fields[0]["label"] = "Changed"
+    form_manager.form.add_field(_make_field("text", "notes", "Notes"))
+    fields = form_manager.list_fields()
+    assert fields[0]["label"] == "Summary"
+    assert fields[-1]["id"] == "notes"
+
+
+def test_lookups_see_fields_added_after_creation(form_manager):
+    form_manager.form.add_field(_make_field("text", "notes", "Notes"))
+
+    assert form_manager._get_field_by_id_or_label("Notes").field_id == "notes"
+    form_filled = form_manager.set_field_values(
+        {
+            "summary": "Test summary",
+            "priority": "high",
+            "description": "Test description",
+            "Notes": "Extra",
+        }
+    )
+    assert form_filled.filled_values["notes"] == "Extra"
+
 
 def test_list_field_values(form_manager):
     priority_values = form_manager.list_field_values("priority")
@@ -114,6 +190,17 @@ def test_validate_missing_required_field(form_manager):
         form_manager.validate(filled_values)
 
 
+def test_validate_required_field_added_after_creation(form_manager):
+    form_manager.form.add_field(_make_field("text", "notes", "Notes", required=True))
+    filled_values = {
+        "summary": "Test summary",
+        "priority": "high",
+        "description": "Test description",
+    }
+    with pytest.raises(ValueError, match="Missing required fields: {'notes'}"):
+        form_manager.set_field_values(filled_values)
+
+
 def test_validate_invalid_choice(form_manager):
     filled_values = {
         "summary": "Test summary",
@@ -152,6 +239,23 @@ def test_set_field_values_with_labels(form_manager):
     assert form_filled.filled_values["description"] == "Test description"
 
 
+def test_set_field_values_many(form_manager):
+    batch = [
+        {"summary": "First", "priority": "high", "description": "One"},
+        {"Summary": "Second", "Priority": "High", "Description": "Two"},
+    ]
+    forms_filled = form_manager.set_field_values_many(batch)
+    assert [form.filled_values["summary"] for form in forms_filled] == [
+        "First",
+        "Second",
+    ]
+    assert forms_filled[1].filled_values["priority"] == "high"
+
+    batch.append({"summary": "Third", "priority": "high"})
+    with pytest.raises(ValueError, match="Missing required fields"):
+        form_manager.set_field_values_many(batch)
+
+
 def test_set_field_values_invalid(form_manager):
     filled_values = {
         "summary": "Test summary",
@@ -177,6 +281,90 @@ def test_to_request_payload(form_manager):
     assert "proformaFormData=" in payload
 
 
+def test_to_request_payload_proforma_data(form_manager):
+    form_filled = ServiceDeskFormFilled(
+        form=form_manager.form,
+        filled_values={
+            "summary": "Test summary",
+            "description": "Test description",
+            "unknown_field": "ignored",
+        },
+    )
+    payload = urllib.parse.parse_qs(form_filled.to_request_payload())
+
+    assert payload["summary"] == ["Test summary"]
+    assert "description" not in payload
+    assert "unknown_field" not in payload
+    proforma_data = json.loads(payload["proformaFormData"][0])
+    assert proforma_data["templateFormId"] == 123
+    assert proforma_data["answers"]["PROFORMA-1"]["adf"]["content"][0]["content"][
+        0
+    ] == {"type": "text", "text": "Test description"}
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["customfield_10001", "Test summary", "a&b=c", "ação", "2023-05-15T10:30", 42],
+)
+def test_quote_value_matches_urlencode(value):
+    assert _quote_value(value) == urllib.parse.urlencode({"": value})[1:]
+
+
+def test_encode_proforma_data_matches_json_dumps():
+    answers = {"1": {"text": "a"}, 2: {"text": "b"}, None: {"text": "c"}}
+    assert json.loads(_encode_proforma_data(7, answers)) == json.loads(
+        json.dumps({"templateFormId": 7, "answers": answers})
+    )
+    with pytest.raises(TypeError):
+        _encode_proforma_data(7, {("a",): {}})
+
+
+def test_to_request_payload_proforma_datetime(sample_form):
+    sample_form.add_field(
+        ServiceDeskFormField(
+            field_type="dt",
+            field_id="due_date",
+            label="Due Date",
+            required=False,
+            displayed=True,
+            field_config_id="",
+            description="",
+            description_html="",
+            is_proforma_field=True,
+            proforma_question_id="PROFORMA-2",
+        )
+    )
+    form_filled = ServiceDeskFormFilled(
+        form=sample_form, filled_values={"due_date": "2023-05-15T10:30"}
+    )
+    payload = urllib.parse.parse_qs(form_filled.to_request_payload())
+
+    proforma_data = json.loads(payload["proformaFormData"][0])
+    assert proforma_data["answers"]["PROFORMA-2"] == {
+        "date": "2023-05-15",
+        "time": "10:30",
+    }
+
+
+@pytest.mark.parametrize("value", ["2023-05-15", "2023-05-15T10:30T00"])
+def test_to_request_payload_proforma_datetime_invalid(sample_form, value):
+    sample_form.add_field(
+        _make_field(
+            "dt",
+            "due_date",
+            "Due Date",
+            is_proforma_field=True,
+            proforma_question_id="PROFORMA-2",
+        )
+    )
+    form_filled = ServiceDeskFormFilled(
+        form=sample_form, filled_values={"due_date": value}
+    )
+
+    with pytest.raises(ValueError, match="YYYY-MM-DDTHH:MM"):
+        form_filled.to_request_payload()
+
+
 def test_create_request_payload(form_manager):
     filled_values = {
         "summary": "Test summary",
@@ -216,5 +404,28 @@ def test_convert_labels_to_ids_invalid_value(form_manager):
         form_manager._convert_labels_to_ids(filled_values)
 
 
+def test_set_field_values_compound(cascading_form_manager):
+    filled_values = {
+        "summary": "Test summary",
+        "priority": "high",
+        "description": "Test description",
+        "Category": ("Hardware", "Monitor"),
+    }
+    form_filled = cascading_form_manager.set_field_values(filled_values)
+    assert form_filled.filled_values["category"] == "1"
+    assert form_filled.filled_values["category:1"] == "12"
+
+
+def test_set_field_values_invalid_compound(cascading_form_manager):
+    filled_values = {
+        "summary": "Test summary",
+        "priority": "high",
+        "description": "Test description",
+        "category": ("Hardware", "Keyboard"),
+    }
+    with pytest.raises(ValueError, match="Invalid compound value"):
+        cascading_form_manager.set_field_values(filled_values)
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -1,3 +1,6 @@
+import copy
+import dataclasses
+import json
 from typing import Any, Dict
 
 import pytest
@@ -10,7 +13,8 @@ from atlassianforms.form.parser import (
 )
 
 
-@pytest.fixture
+# Shared by the whole module: tests must not modify it in place.
+@pytest.fixture(scope="module")
 def sample_json_data() -> Dict[str, Any]:
     return {
         "portal": {
@@ -92,8 +96,24 @@ def sample_json_data() -> Dict[str, Any]:
     }
 
 
-def test_parse_service_desk_form(sample_json_data):
-    form = ServiceDeskFormParser.parse(sample_json_data)
+@pytest.fixture
+def mutable_json_data(sample_json_data) -> Dict[str, Any]:
+    return copy.deepcopy(sample_json_data)
+
+
+# Parsed once for the read-only tests; tests that modify the form use fresh_form.
+@pytest.fixture(scope="module")
+def parsed_form(sample_json_data) -> ServiceDeskForm:
+    return ServiceDeskFormParser.parse(sample_json_data)
+
+
+@pytest.fixture
+def fresh_form(sample_json_data) -> ServiceDeskForm:
+    return ServiceDeskFormParser.parse(sample_json_data)
+
+
+def test_parse_service_desk_form(parsed_form):
+    form = parsed_form
 
     assert isinstance(form, ServiceDeskForm)
     assert form.id == "PORTAL-123"
@@ -110,37 +130,40 @@ def test_parse_service_desk_form(sample_json_data):
     assert form.atl_token == "TOKEN-789"
 
 
-def test_parse_standard_fields(sample_json_data):
-    form = ServiceDeskFormParser.parse(sample_json_data)
+def test_parse_bytes(sample_json_data):
+    raw = json.dumps(sample_json_data).encode()
+    assert ServiceDeskFormParser.parse_bytes(raw) == ServiceDeskFormParser.parse(
+        sample_json_data
+    )
+
+
+def test_parse_standard_fields(parsed_form):
+    form = parsed_form
 
     assert len(form.fields) == 4  # 3 standard fields + 1 proforma field
 
-    summary_field = next(field for field in form.fields if field.field_id == "summary")
+    summary_field = form.get_field_by_id("summary")
     assert summary_field.field_type == "text"
     assert summary_field.label == "Summary"
     assert summary_field.required == True
 
-    description_field = next(
-        field for field in form.fields if field.field_id == "description"
-    )
+    description_field = form.get_field_by_id("description")
     assert description_field.field_type == "textarea"
     assert description_field.renderer_type == "wiki"
 
-    priority_field = next(
-        field for field in form.fields if field.field_id == "priority"
-    )
+    priority_field = form.get_field_by_id("priority")
     assert priority_field.field_type == "select"
     assert len(priority_field.values) == 3
     assert priority_field.values[1].value == "medium"
     assert priority_field.values[1].selected == True
 
 
-def test_parse_proforma_field(sample_json_data):
-    form = ServiceDeskFormParser.parse(sample_json_data)
+def test_parse_proforma_field(parsed_form):
+    form = parsed_form
 
-    proforma_field = next(field for field in form.fields if field.is_proforma_field)
+    proforma_field = form.get_field_by_id("customfield_10001")
+    assert proforma_field.is_proforma_field
     assert proforma_field.field_type == "text"
-    assert proforma_field.field_id == "customfield_10001"
     assert proforma_field.label == "Custom Field"
     assert proforma_field.required == True
     assert proforma_field.proforma_question_id == "CUSTOM-001"
@@ -204,5 +227,218 @@ def test_parse_cascadingselect_field():
     assert subfield.depends_on == "cascading"
 
 
+def test_field_and_value_lookups(parsed_form):
+    form = parsed_form
+
+    priority_field = form.get_field_by_id("priority")
+    assert priority_field is form.fields[2]
+    assert form.get_field_by_id("non_existent") is None
+    assert form.get_field_by_id_or_label("priority") is priority_field
+    assert form.get_field_by_id_or_label(priority_field.label) is priority_field
+    assert form.get_field_by_id_or_label("non_existent") is None
+
+    assert priority_field.get_value("high").label == "High"
+    assert priority_field.get_value("Medium").value == "medium"
+    assert priority_field.get_value("non_existent") is None
+    assert priority_field.get_value_by_label("Low").value == "low"
+    assert priority_field.get_value_by_label("low") is None
+
+    parent = ServiceDeskFormFieldValue(value="parent", label="Parent")
+    parent.add_child(ServiceDeskFormFieldValue(value="child", label="Child"))
+    assert parent.get_child("Child").value == "child"
+    assert parent.get_child("child").label == "Child"
+
+
+def test_field_summaries_refresh_after_add_field(fresh_form):
+    form = fresh_form
+    required_ids = [field.field_id for field in form.get_required_fields()]
+    assert form.get_dependent_fields() == []
+
+    form.add_field(
+        ServiceDeskFormField(
+            field_type="text",
+            field_id="dependent",
+            field_config_id="",
+            label="Dependent",
+            description="",
+            description_html="",
+            required=True,
+            displayed=True,
+            auto_complete_url="/autocomplete",
+            depends_on="summary",
+        )
+    )
+
+    assert [field.field_id for field in form.get_required_fields()] == [
+        *required_ids,
+        "dependent",
+    ]
+    assert [field.field_id for field in form.get_dependent_fields()] == ["dependent"]
+    assert form.has_autocomplete_fields()
+    assert form.get_field_by_id_or_label("Dependent") is form.fields[-1]
+
+
+def test_lookups_follow_direct_list_changes(fresh_form):
+    form = fresh_form
+    assert form.get_field_by_id("late") is None
+    assert not form.get_dependent_fields()
+
+    late_field = dataclasses.replace(
+        form.fields[0], field_id="late", label="Late", depends_on="summary"
+    )
+    form.fields.append(late_field)
+
+    assert form.get_field_by_id("late") is late_field
+    assert form.get_field_by_id_or_label("Late") is late_field
+    assert form.get_dependent_fields() == [late_field]
+
+    form.fields = [late_field]
+    assert form.get_field_by_id("summary") is None
+
+    parent = ServiceDeskFormFieldValue(value="parent", label="Parent")
+    assert parent.get_child("child") is None
+    parent.children.append(ServiceDeskFormFieldValue(value="child", label="Child"))
+    assert parent.get_child("child").label == "Child"
+    parent.add_child(ServiceDeskFormFieldValue(value="other", label="Other"))
+    assert parent.get_child("Other").value == "other"
+
+
+def test_value_lookups_follow_reassigned_values():
+    field = ServiceDeskFormField(
+        field_type="select",
+        field_id="priority",
+        field_config_id="",
+        label="Priority",
+        description="",
+        description_html="",
+        required=False,
+        displayed=True,
+        values=[ServiceDeskFormFieldValue(value="high", label="High")],
+    )
+    assert field.values == [ServiceDeskFormFieldValue(value="high", label="High")]
+    assert field.get_choice_values() == frozenset({"high"})
+
+    field.values = [*field.values, ServiceDeskFormFieldValue(value="low", label="Low")]
+
+    assert field.get_choice_values() == frozenset({"high", "low"})
+    assert field.get_value("Low").value == "low"
+    assert field.get_value_by_label("Low").value == "low"
+
+    field.values.append(ServiceDeskFormFieldValue(value="none", label="None"))
+
+    assert field.get_choice_values() == frozenset({"high", "low", "none"})
+    assert field.get_value("None").value == "none"
+
+
+def test_make_field_value_matches_init():
+    made = ServiceDeskFormFieldValue._make(
+        "value", "Label", True, additional_data={"key": "data"}
+    )
+    assert made == ServiceDeskFormFieldValue(
+        value="value", label="Label", selected=True, additional_data={"key": "data"}
+    )
+    made.add_child(ServiceDeskFormFieldValue._make("child", "Child"))
+    assert made.get_child("Child").value == "child"
+    assert made.has_children()
+
+
+def test_parse_nested_values():
+    values = ServiceDeskFormParser._parse_values(
+        [
+            {
+                "value": "1",
+                "label": "One",
+                "children": [
+                    {
+                        "value": "11",
+                        "label": "One One",
+                        "children": [{"value": "111", "label": "One One One"}],
+                    },
+                    {"value": "12", "label": "One Two"},
+                ],
+            },
+            {"value": "2", "label": "Two", "selected": True},
+        ]
+    )
+
+    assert [value.value for value in values] == ["1", "2"]
+    assert values[1].selected is True
+    assert [child.value for child in values[0].children] == ["11", "12"]
+    assert values[0].children[0].children[0].label == "One One One"
+    assert values[0].get_child("One Two").value == "12"
+    assert values[1].children == []
+
+
+def test_parse_autocomplete_field(mutable_json_data):
+    mutable_json_data["reqCreate"]["fields"].append(
+        {
+            "fieldType": "cmdbobjectpicker",
+            "fieldId": "customfield_10002",
+            "label": "Affected Asset",
+            "description": "The affected asset",
+            "required": False,
+            "displayed": True,
+            "autoCompleteUrl": "/autocomplete",
+        }
+    )
+    mutable_json_data["reqCreate"]["autocompleteOptions"] = [
+        {
+            "fieldId": "customfield_10002",
+            "results": [
+                {
+                    "objectId": "OBJ-1",
+                    "label": "Laptop 1",
+                    "workspaceId": "WS-1",
+                    "objectKey": "ASSET-1",
+                    "objectType": {
+                        "objectTypeId": "1",
+                        "id": "1",
+                        "name": "Laptop",
+                        "description": "A laptop",
+                    },
+                    "attributes": [
+                        {
+                            "objectTypeAttributeId": "10",
+                            "objectTypeAttribute": {
+                                "name": "Name",
+                                "type": 0,
+                                "description": "The name",
+                            },
+                            "objectAttributeValues": [{"value": "Laptop 1"}],
+                        }
+                    ],
+                }
+            ],
+        }
+    ]
+
+    results = mutable_json_data["reqCreate"]["autocompleteOptions"][0]["results"]
+    results.append(
+        {**results[0], "objectId": "OBJ-2", "label": "Laptop 2", "objectKey": "ASSET-2"}
+    )
+
+    form = ServiceDeskFormParser.parse(mutable_json_data)
+
+    assert len(form.fields) == 5
+    autocomplete_field = form.fields[-1]
+    assert autocomplete_field.field_id == "customfield_10002"
+    assert autocomplete_field.field_type == "cmdbobjectpicker"
+    assert autocomplete_field.is_proforma_field is False
+    assert len(autocomplete_field.values) == 2
+    value, other_value = autocomplete_field.values
+    assert value.value == "OBJ-1"
+    assert value.label == "Laptop 1"
+    assert value.additional_data["objectKey"] == "ASSET-1"
+    assert value.additional_data["objectType"]["name"] == "Laptop"
+    assert value.additional_data["objectTypeAttributeName"] == "Name"
+    assert value.additional_data["objectTypeAttributeValues"] == [{"value": "Laptop 1"}]
+    assert other_value.additional_data["objectKey"] == "ASSET-2"
+    assert (
+        other_value.additional_data["objectType"] is value.additional_data["objectType"]
+    )
+    with pytest.raises(TypeError):
+        value.additional_data["objectType"]["name"] = "Desktop"
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -9,7 +9,8 @@ from atlassianforms.models.response import (
 )
 
 
-@pytest.fixture
+# Shared by the whole module: tests must not modify it in place.
+@pytest.fixture(scope="module")
 def sample_response_data():
     return {
         "reporter": {
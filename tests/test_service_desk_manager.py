@@ -4,7 +4,7 @@ from unittest.mock import Mock, patch
 import pytest
 import requests
 
-from atlassianforms.form.parser import ServiceDeskForm
+from atlassianforms.form.parser import ServiceDeskForm, ServiceDeskFormField
 from atlassianforms.manager import (
     ServiceDeskFormFilled,
     ServiceDeskManager,
@@ -12,6 +12,18 @@ from atlassianforms.manager import (
     remove_disposable_keys,
 )
 
+# Response bodies shared by the HTTP tests; the code under test decodes them
+# into fresh objects, so they are never modified.
+_ISSUE_KEY_CONTENT = json.dumps({"issueKey": "SD-123"}).encode()
+_AUTOCOMPLETE_CONTENT = json.dumps(
+    {
+        "results": [
+            {"objectId": "OBJ-1", "label": "Option 1"},
+            {"objectId": "OBJ-2", "label": "Option 2"},
+        ]
+    }
+).encode()
+
 
 @pytest.fixture
 def service_desk_manager():
@@ -25,11 +37,26 @@ def mock_response():
     return mock
 
 
-@patch("requests.post")
+def test_session_reuses_default_headers(service_desk_manager):
+    session = service_desk_manager.session
+    assert session.headers["Authorization"].startswith("Basic ")
+    assert session.headers["content-type"] == "application/json"
+    assert "gzip" in session.headers["accept-encoding"]
+    assert session.get_adapter("https://example.atlassian.net") is (
+        session.get_adapter("http://example.atlassian.net")
+    )
+
+    with patch.object(session, "close") as mock_close:
+        with service_desk_manager as manager:
+            assert manager is service_desk_manager
+    mock_close.assert_called_once()
+
+
+@patch("requests.Session.post")
 def test_create_request_success(mock_post, service_desk_manager):
     mock_response = Mock()
     mock_response.status_code = 201
-    mock_response.json.return_value = {"issueKey": "SD-123"}
+    mock_response.content = _ISSUE_KEY_CONTENT
     mock_post.return_value = mock_response
 
     form = ServiceDeskForm(
@@ -49,9 +76,12 @@ def test_create_request_success(mock_post, service_desk_manager):
     result = service_desk_manager.create_request(form_filled)
 
     assert result["issueKey"] == "SD-123"
+    assert (
+        mock_post.call_args.kwargs["data"] == form_filled.to_request_payload().encode()
+    )
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_create_request_failure(mock_post, service_desk_manager):
     mock_response = Mock()
     mock_response.status_code = 400
@@ -79,6 +109,149 @@ def test_create_request_failure(mock_post, service_desk_manager):
     assert "Bad Request" in str(excinfo.value)
 
 
+def _filled_form(project_id="PROJ-1"):
+    form = ServiceDeskForm(
+        id="FORM-1",
+        service_desk_id="1",
+        request_type_id="10",
+        project_id=project_id,
+        portal_name="Test Portal",
+        form_name="Test Form",
+        portal_description="Test Description",
+        form_description_html="<p>Test Form Description</p>",
+    )
+    return ServiceDeskFormFilled(form=form, filled_values={"summary": "Test Issue"})
+
+
+@patch("time.sleep")
+@patch("requests.Session.post")
+def test_create_request_retries_rate_limited(
+    mock_post, mock_sleep, service_desk_manager
+):
+    rate_limited = Mock(status_code=429, headers={"Retry-After": "2"})
+    created = Mock(status_code=201, content=_ISSUE_KEY_CONTENT)
+    mock_post.side_effect = [rate_limited, created]
+
+    result = service_desk_manager.create_request(_filled_form())
+
+    assert result == {"issueKey": "SD-123"}
+    assert mock_post.call_count == 2
+    mock_sleep.assert_called_once_with(2.0)
+
+
+def test_session_retry_after_is_capped(service_desk_manager):
+    retry = service_desk_manager.session.get_adapter("https://").max_retries
+    response = Mock(headers={"Retry-After": "3600"})
+
+    assert retry.get_retry_after(response) == service_desk_manager.RATE_LIMIT_MAX_DELAY
+    assert retry.get_retry_after(Mock(headers={"Retry-After": "2"})) == 2
+    assert retry.get_retry_after(Mock(headers={})) is None
+    assert retry.new(total=1).get_retry_after(response) == retry.max_retry_after
+
+
+def test_retry_delay_is_capped(service_desk_manager):
+    service_desk_manager.RATE_LIMIT_MAX_DELAY = 5.0
+    long_wait = Mock(headers={"Retry-After": "3600"})
+    assert service_desk_manager._retry_delay(long_wait, 0) == 5.0
+    assert service_desk_manager._retry_delay(Mock(headers={}), 10) == 5.0
+    assert service_desk_manager._retry_delay(Mock(headers={}), 0) == 0.5
+
+
+@patch("requests.Session.post")
+def test_fetch_autocomplete_options_without_autocomplete_fields(
+    mock_post, service_desk_manager
+):
+    form_data = {
+        "portalId": 1,
+        "reqCreate": {"id": 10, "fields": [{"fieldId": "summary"}]},
+    }
+
+    assert service_desk_manager._fetch_autocomplete_options(form_data) == []
+    mock_post.assert_not_called()
+
+
+@patch("time.sleep")
+@patch("requests.Session.post")
+def test_fetch_autocomplete_options_rate_limited(
+    mock_post, mock_sleep, service_desk_manager
+):
+    rate_limited = Mock(status_code=429, headers={})
+    options = Mock(status_code=200, content=b'{"results": []}')
+    mock_post.side_effect = [rate_limited, rate_limited, options]
+    form_data = {
+        "portalId": 1,
+        "reqCreate": {
+            "id": 10,
+            "fields": [
+                {
+                    "fieldId": "customfield_10000",
+                    "fieldType": "cmdbobjectpicker",
+                    "autoCompleteUrl": "/autocomplete",
+                }
+            ],
+        },
+    }
+
+    result = service_desk_manager._fetch_autocomplete_options(form_data)
+
+    assert result[0]["results"] == []
+    assert [call.args[0] for call in mock_sleep.call_args_list] == [0.5, 1.0]
+
+
+@patch("requests.Session.post")
+def test_create_requests(mock_post, service_desk_manager):
+    def post(url, headers, data):
+        if b"Broken" in data:
+            return Mock(status_code=400, text="Bad Request")
+        return Mock(status_code=201, content=b'{"issueKey": "SD-1"}')
+
+    mock_post.side_effect = post
+
+    results = service_desk_manager.create_requests(
+        [_filled_form("PROJ-1"), _filled_form("Broken"), _filled_form("PROJ-3")]
+    )
+
+    assert results[0] == {"issueKey": "SD-1"}
+    assert isinstance(results[1], ServiceDeskRequestError)
+    assert results[1].status_code == 400
+    assert results[2] == {"issueKey": "SD-1"}
+    assert service_desk_manager.create_requests([]) == []
+
+
+@patch("requests.Session.post")
+def test_create_requests_keeps_each_form_result(mock_post, service_desk_manager):
+    def post(url, headers, data):
+        if b"BadJson" in data:
+            return Mock(status_code=201, content=b"<html>")
+        return Mock(status_code=201, content=b'{"issueKey": "SD-1"}')
+
+    mock_post.side_effect = post
+    invalid = _filled_form("PROJ-2")
+    invalid.form.add_field(
+        ServiceDeskFormField(
+            field_type="dt",
+            field_id="due_date",
+            field_config_id="",
+            label="Due Date",
+            description="",
+            description_html="",
+            required=False,
+            displayed=True,
+            is_proforma_field=True,
+            proforma_question_id="1",
+        )
+    )
+    invalid.filled_values["due_date"] = "2023-05-15t10:30"
+
+    results = service_desk_manager.create_requests(
+        [_filled_form("PROJ-1"), invalid, _filled_form("BadJson")]
+    )
+
+    assert results[0] == {"issueKey": "SD-1"}
+    assert isinstance(results[1], ValueError)
+    assert isinstance(results[2], ValueError)
+
+
 def test_remove_disposable_keys():
     test_data = {
         "keep": "value",
@@ -99,18 +272,13 @@ def test_remove_disposable_keys():
     assert "remove" not in result["nested"]
     assert "keep" in result["list"][0]
     assert "remove" not in result["list"][0]
+    assert "remove" not in result["list"][1]
+    assert result is test_data
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_fetch_autocomplete_options(mock_post, service_desk_manager):
-    mock_response = Mock()
-    mock_response.json.return_value = {
-        "results": [
-            {"objectId": "OBJ-1", "label": "Option 1"},
-            {"objectId": "OBJ-2", "label": "Option 2"},
-        ]
-    }
-    mock_post.return_value = mock_response
+    mock_post.return_value = Mock(content=_AUTOCOMPLETE_CONTENT)
 
     form_data = {
         "portalId": 1,
@@ -138,6 +306,166 @@ def test_fetch_autocomplete_options(mock_post, service_desk_manager):
     assert result[0]["fieldLabel"] == "CMDB Object"
     assert len(result[0]["results"]) == 2
     assert result[0]["results"][0]["objectId"] == "OBJ-1"
+    assert json.loads(mock_post.call_args.kwargs["data"]) == {
+        "fieldValueMap": {"customfield_10000": ""},
+        "query": "",
+    }
+
+
+@patch("requests.Session.post")
+def test_fetch_autocomplete_options_concurrently(
+    mock_post, service_desk_manager, caplog
+):
+    def post(url, **kwargs):
+        response = Mock()
+        field_id = url.split("/field/")[1].split("/")[0]
+        if field_id == "customfield_10001":
+            response.status_code = 500
+            response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+                "500 Server Error", response=response
+            )
+        response.content = json.dumps({"results": [{"objectId": field_id}]}).encode()
+        return response
+
+    mock_post.side_effect = post
+    field_ids = ["customfield_10000", "customfield_10001", "customfield_10002"]
+    form_data = {
+        "portalId": 1,
+        "reqCreate": {
+            "id": 10,
+            "fields": [
+                {
+                    "fieldId": field_id,
+                    "fieldType": "cmdbobjectpicker",
+                    "autoCompleteUrl": "/autocomplete",
+                }
+                for field_id in field_ids
+            ],
+        },
+    }
+
+    result = service_desk_manager._fetch_autocomplete_options(form_data)
+
+    assert mock_post.call_count == 3
+    assert [options["fieldId"] for options in result] == field_ids
+    assert result[0]["results"] == [{"objectId": "customfield_10000"}]
+    assert "results" not in result[1]
+    assert "field customfield_10001: status 500" in caplog.text
+    assert result[2]["results"] == [{"objectId": "customfield_10002"}]
+
+
+def test_fetch_form_merges_concurrent_fetches(service_desk_manager):
+    form_data = {"portalId": 1, "reqCreate": {"id": 10, "proformaTemplateForm": {}}}
+    with patch.object(
+        service_desk_manager, "_fetch_form_data", return_value=form_data
+    ), patch.object(
+        service_desk_manager,
+        "_fetch_proforma_options",
+        return_value={"fields": {"1": []}},
+    ) as mock_proforma, patch.object(
+        service_desk_manager, "_fetch_autocomplete_options", return_value=[]
+    ) as mock_autocomplete:
+        result = service_desk_manager.fetch_form(1, 10)
+
+    mock_proforma.assert_called_once_with(1, 10)
+    mock_autocomplete.assert_called_once_with(form_data)
+    assert result["reqCreate"]["proformaTemplateForm"]["proformaFieldOptions"] == {
+        "fields": {"1": []}
+    }
+    assert result["reqCreate"]["autocompleteOptions"] == []
+
+
+@patch("requests.Session.get")
+def test_fetch_proforma_options_is_cached(mock_get, service_desk_manager):
+    service_desk_manager.PROFORMA_CACHE_TTL = 600.0
+    service_desk_manager.PROFORMA_CACHE_MAXSIZE = 1
+    tenant_info = Mock()
+    tenant_info.content = json.dumps({"cloudId": "CLOUD-1"}).encode()
+    form_choices = Mock()
+    form_choices.content = json.dumps({"fields": {}}).encode()
+    mock_get.side_effect = lambda url: (
+        tenant_info if url.endswith("/_edge/tenant_info") else form_choices
+    )
+
+    assert service_desk_manager._fetch_proforma_options(1, 10) == {"fields": {}}
+    assert service_desk_manager._fetch_proforma_options(1, 10) == {"fields": {}}
+    assert service_desk_manager._fetch_proforma_options(1, 11) == {"fields": {}}
+    # Only one entry is kept, so request type 10 was evicted.
+    assert service_desk_manager._fetch_proforma_options(1, 10) == {"fields": {}}
+
+    urls = [call.args[0] for call in mock_get.call_args_list]
+    form_choices_url = (
+        "https://example.atlassian.net/gateway/api/proforma/portal/cloudid/CLOUD-1"
+        "/api/3/portal/1/requesttype/{}/formchoices"
+    )
+    assert urls == [
+        "https://example.atlassian.net/_edge/tenant_info",
+        form_choices_url.format(10),
+        form_choices_url.format(11),
+        form_choices_url.format(10),
+    ]
+
+
+@patch("requests.Session.get")
+def test_fetch_proforma_options_is_not_cached_by_default(
+    mock_get, service_desk_manager
+):
+    mock_get.return_value.content = json.dumps({"fields": {}}).encode()
+    service_desk_manager.cloud_id = "CLOUD-1"
+
+    service_desk_manager._fetch_proforma_options(1, 10)
+    service_desk_manager._fetch_proforma_options(1, 10)
+
+    assert mock_get.call_count == 2
+
+
+def _form_payload(token, proforma_options=None, autocomplete_options=None):
+    return {
+        "xsrfToken": token,
+        "reqCreate": {
+            "fields": [],
+            "proformaTemplateForm": {"proformaFieldOptions": proforma_options},
+            "autocompleteOptions": autocomplete_options,
+        },
+    }
+
+
+def test_fetch_form_is_not_cached_by_default(service_desk_manager):
+    with patch.object(
+        service_desk_manager,
+        "_fetch_form_uncached",
+        side_effect=lambda *_: _form_payload("token"),
+    ) as mock_fetch:
+        service_desk_manager.fetch_form(1, 10)
+        service_desk_manager.fetch_form(1, 10)
+
+        assert mock_fetch.call_count == 2
+
+
+def test_fetch_form_caches_options_but_not_token(service_desk_manager):
+    service_desk_manager.FORM_CACHE_TTL = 300.0
+    tokens = iter(["fresh-1", "fresh-2"])
+    with patch.object(
+        service_desk_manager,
+        "_fetch_form_uncached",
+        side_effect=lambda *_: _form_payload("token", {"opts": []}, [{"id": "a"}]),
+    ) as mock_fetch, patch.object(
+        service_desk_manager,
+        "_fetch_form_data",
+        side_effect=lambda *_: _form_payload(next(tokens)),
+    ) as mock_fetch_data:
+        first = service_desk_manager.fetch_form(1, 10)
+        first["reqCreate"]["autocompleteOptions"].append("mutated")
+        second = service_desk_manager.fetch_form(1, 10)
+        service_desk_manager.fetch_form(1, 11)
+
+        assert second == _form_payload("fresh-1", {"opts": []}, [{"id": "a"}])
+        assert mock_fetch.call_count == 2
+        assert mock_fetch_data.call_count == 1
+
+        service_desk_manager.clear_form_cache()
+        service_desk_manager.fetch_form(1, 10)
+        assert mock_fetch.call_count == 3
 
 
 if __name__ == "__main__":